@@ -0,0 +1,46 @@
+"""
+Shared Data I/O Helpers
+
+Parsing helpers shared by the projection engine and the stats agent. This module holds no
+cached data of its own.
+"""
+
+import os
+import pandas as pd
+
+def read_with_sidecar(source_file, reader, pickle_file=None):
+    """
+    Parse a source file, reusing a pickle sidecar of the parsed frame when it is current.
+    
+    The sidecar is rewritten whenever the source is newer, so edits to the source file are
+    always picked up.
+    
+    Args:
+        source_file: Path to the CSV/Excel source
+        reader: Callable taking the path and returning the parsed DataFrame
+        pickle_file: Sidecar path (default: the source path with a .pkl suffix); readers that
+            keep only part of the file need their own sidecar
+    
+    Returns:
+        DataFrame: Parsed source data
+    """
+    if pickle_file is None:
+        pickle_file = os.path.splitext(source_file)[0] + ".pkl"
+    if os.path.exists(pickle_file) and os.path.getmtime(pickle_file) >= os.path.getmtime(source_file):
+        try:
+            return pd.read_pickle(pickle_file)
+        except Exception as e:
+            print(f"Could not load {pickle_file}, re-reading {source_file}: {e}")
+    
+    df = reader(source_file)
+    # Write to a private temp file and rename it into place, so concurrent readers never
+    # see a partially written sidecar
+    temp_file = f"{pickle_file}.{os.getpid()}.tmp"
+    try:
+        df.to_pickle(temp_file)
+        os.replace(temp_file, pickle_file)
+    except OSError as e:
+        print(f"Could not write {pickle_file}: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    return df
@@ -10,6 +10,7 @@ import sys
 import os
 import csv
 import re
+import textwrap
 from typing import Dict, Any, List, Tuple
 from datetime import datetime
 
@@ -135,8 +136,6 @@ def print_formatted_analysis(week_number: int, picks: List[Dict], stats: List[Di
         picks: List of pick dictionaries
         stats: List of stat dictionaries
     """
-    import textwrap
-    
     print("=" * 100)
     print(f"NFL WEEK {week_number} ANALYSIS")
     print("=" * 100)
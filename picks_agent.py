@@ -48,7 +48,7 @@ def load_master_roster():
     """
     try:
         # Read Excel file
-        roster_df = pd.read_excel('data/master_roster.xlsx')
+        roster_df = pd.read_excel('data/master_roster.xlsx', usecols=['Player', 'team_name'])
         
         # Create player to team mapping using correct column names
         player_team_mapping = dict(zip(roster_df['Player'], roster_df['team_name']))
@@ -5,10 +5,124 @@ import pandas as pd
 import numpy as np
 import ast
 import os
+import re
 from datetime import datetime as dt
+from data_io import read_with_sidecar
 
-# Global variable for current week parameter
-current_week_param = 0
+# Rows reduced per pass when aggregating player-week game data
+AGG_CHUNK_ROWS = 2**17
+
+# Team stat column groups used by analyze (order matches the team dataset)
+OFFENSE_COLS = ['pass_cmp', 'pass_att', 'pass_yd', 'pass_td', 'pass_int', 'sacks', 'rush_att', 'rush_yd',
+                'rush_td', 'targets', 'rec', 'rec_yd', 'rec_td', 'off_fum']
+DEFENSE_COLS = ['def_pass_cmp', 'def_pass_att', 'def_pass_yd', 'def_pass_td', 'def_int', 'def_sacks',
+                'def_rush_att', 'def_rush_yd', 'def_rush_td', 'def_targets', 'def_rec', 'def_rec_yd',
+                'def_rec_td', 'def_fum']
+TEAM_STAT_COLS = OFFENSE_COLS + DEFENSE_COLS
+RATIO_COLS = [f"ratio_{c}" for c in TEAM_STAT_COLS]
+
+# Per-attempt projection stats: (output column, attempt driver columns, per-attempt stat,
+# schedule-strength stat, next-opponent ratio column)
+PROJ_RATE_STATS = [
+    ("proj_pass_yd", ("proj_pass_att",), "pass_yd", "def_pass_yd", "ratio_def_pass_yd"),
+    ("proj_pass_td", ("proj_pass_att",), "pass_td", "def_pass_td", "ratio_def_pass_td"),
+    ("proj_int", ("proj_pass_att",), "pass_int", "def_int", "ratio_def_int"),
+    ("proj_rush_yd", ("proj_rush_att",), "rush_yd", "def_rush_yd", "ratio_def_rush_yd"),
+    ("proj_rush_td", ("proj_rush_att",), "rush_td", "def_rush_td", "ratio_def_rush_td"),
+    ("proj_rec", ("proj_tar",), "rec", "def_rec", "ratio_def_rec"),
+    ("proj_rec_yd", ("proj_tar",), "rec_yd", "def_rec_yd", "ratio_def_rec_yd"),
+    ("proj_rec_td", ("proj_tar",), "rec_td", "def_rec_td", "ratio_def_rec_td"),
+    ("proj_fum", ("proj_tar", "proj_rush_att"), "fum", "def_fum", "def_fum"),
+]
+
+# Roster status suffixes stripped from player names, and whitespace runs to collapse
+_ROSTER_SUFFIX_RE = re.compile(r'\((?:IR|PUP|NFI|COVID|SUSP|RESERVE)\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Separator for the opps list when a team dataset is written to CSV, e.g. "ATL|BAL"
+OPPS_SEP = '|'
+
+# Roster workbook columns the projection engine uses (the rest are skipped at parse time)
+ROSTER_COLS = ['Player', 'team_name']
+
+# Parsed master roster per (path, mtime), shared by load_active_roster and create_player_team_mapping
+_roster_cache = {}
+
+# Parsed game-data CSVs per (path, mtime), reused across weeks of a season run
+_game_data_cache = {}
+
+# Output directories already created in this process (skips a makedirs per analyze call)
+_ready_dirs = set()
+
+# Working precision for the per-attempt projection kernel (results are stored back as float64)
+PROJ_DTYPE = np.float32
+
+# Full team names used in the 2025 opponent column -> abbreviations used everywhere else
+TEAM_NAME_TO_ABBREV = {
+    'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL', 'Carolina Panthers': 'CAR',
+    'Chicago Bears': 'CHI', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
+    'Detroit Lions': 'DET', 'Houston Texans': 'HOU', 'Kansas City Chiefs': 'KAN',
+    'Miami Dolphins': 'MIA', 'New England Patriots': 'NWE', 'New Orleans Saints': 'NOR',
+    'New York Giants': 'NYG', 'New York Jets': 'NYJ', 'Seattle Seahawks': 'SEA',
+    'Tennessee Titans': 'TEN'
+}
+
+# Raw per-game stat columns aggregated from the game data CSVs
+GAME_STAT_COLS = ['pass_cmp', 'pass_att', 'pass_yds', 'pass_tds', 'pass_int', 'sacks',
+                  'rush_att', 'rush_yds', 'rush_tds', 'targets', 'receptions', 'rec_yds', 'rec_tds', 'fumbles']
+
+# Storage dtype for game stat columns (counts, exact in float32)
+GAME_STAT_DTYPE = np.float32
+
+# Game data key columns holding team abbreviations (share one categorical dtype)
+TEAM_KEY_COLS = ['team', 'opponent', 'home_team', 'away_team']
+
+def read_game_data(game_file):
+    """
+    Load a season game-data CSV, reusing its parsed pickle sidecar when current.
+    
+    The parsed frame is also memoized per (path, mtime) for the life of the process, so
+    repeated calls (one per projected week) parse the file only once.
+    
+    Args:
+        game_file: Path to a game_data_<year>.csv file
+    
+    Returns:
+        DataFrame: Player game rows for the season (a private copy the caller may modify)
+    """
+    cache_key = (os.path.abspath(game_file), os.path.getmtime(game_file))
+    if cache_key not in _game_data_cache:
+        _game_data_cache[cache_key] = read_with_sidecar(game_file, pd.read_csv)
+    return _game_data_cache[cache_key].copy()
+
+def clean_roster_name(name):
+    """Clean player name by removing (IR), (PUP), etc. and normalizing whitespace"""
+    if pd.isna(name):
+        return None
+    return _WHITESPACE_RE.sub(' ', _ROSTER_SUFFIX_RE.sub('', str(name))).strip()
+
+def load_roster(roster_file="data/master_roster.xlsx"):
+    """
+    Load the master roster with a clean_name column, parsing the workbook at most once per change.
+    
+    Results are memoized per (path, mtime) for the life of the process, and the parsed sheet is
+    kept in a pickle sidecar so later runs skip the Excel parse.
+    
+    Args:
+        roster_file: Path to the master roster Excel file
+    
+    Returns:
+        DataFrame: Roster rows with the original Player column and a clean_name column (shared, do not modify)
+    """
+    if not os.path.exists(roster_file):
+        raise FileNotFoundError(f"Active roster file not found: {roster_file}")
+    
+    cache_key = (os.path.abspath(roster_file), os.path.getmtime(roster_file))
+    if cache_key not in _roster_cache:
+        df_roster = read_with_sidecar(roster_file, lambda path: pd.read_excel(path, usecols=ROSTER_COLS))
+        df_roster['clean_name'] = [clean_roster_name(name) for name in df_roster['Player'].tolist()]
+        _roster_cache[cache_key] = df_roster
+    return _roster_cache[cache_key]
 
 def load_injured_players(injuries_file="data/injuries.csv"):
     """
@@ -74,30 +188,8 @@ def load_active_roster(roster_file="data/master_roster.xlsx", injuries_file="dat
     Returns:
         set: Cleaned set of active player names for filtering (excluding injured players)
     """
-    if not os.path.exists(roster_file):
-        raise FileNotFoundError(f"Active roster file not found: {roster_file}")
-    
     print(f"Loading active roster from {roster_file}...")
-    df_roster = pd.read_excel(roster_file)
-    
-    # Clean player names by removing common suffixes and extra whitespace
-    def clean_player_name(name):
-        """Clean player name by removing (IR), (PUP), etc. and normalizing whitespace"""
-        if pd.isna(name):
-            return None
-        
-        # Remove common injury/status suffixes
-        name = str(name).strip()
-        suffixes_to_remove = ['(IR)', '(PUP)', '(NFI)', '(COVID)', '(SUSP)', '(RESERVE)']
-        for suffix in suffixes_to_remove:
-            name = name.replace(suffix, '').strip()
-        
-        # Normalize multiple spaces to single space
-        name = ' '.join(name.split())
-        return name
-    
-    # Apply cleaning and filter out None values
-    df_roster['clean_name'] = df_roster['Player'].apply(clean_player_name)
+    df_roster = load_roster(roster_file)
     roster_players = set(df_roster['clean_name'].dropna())
     
     print(f"Loaded {len(roster_players)} players from roster")
@@ -129,30 +221,7 @@ def create_player_team_mapping(roster_file="data/master_roster.xlsx"):
     Returns:
         dict: Mapping of clean player names to their current team abbreviations
     """
-    if not os.path.exists(roster_file):
-        raise FileNotFoundError(f"Active roster file not found: {roster_file}")
-    
-    df_roster = pd.read_excel(roster_file)
-    
-    # Clean player names by removing common suffixes and extra whitespace
-    def clean_player_name(name):
-        """Clean player name by removing (IR), (PUP), etc. and normalizing whitespace"""
-        if pd.isna(name):
-            return None
-        
-        # Remove common injury/status suffixes
-        name = str(name).strip()
-        suffixes_to_remove = ['(IR)', '(PUP)', '(NFI)', '(COVID)', '(SUSP)', '(RESERVE)']
-        for suffix in suffixes_to_remove:
-            name = name.replace(suffix, '').strip()
-        
-        # Normalize multiple spaces to single space
-        name = ' '.join(name.split())
-        return name
-    
-    # Apply cleaning and create mapping
-    df_roster['clean_name'] = df_roster['Player'].apply(clean_player_name)
-    df_roster = df_roster.dropna(subset=['clean_name', 'team_name'])
+    df_roster = load_roster(roster_file).dropna(subset=['clean_name', 'team_name'])
     
     # Create player to current team mapping
     player_team_mapping = dict(zip(df_roster['clean_name'], df_roster['team_name']))
@@ -161,6 +230,50 @@ def create_player_team_mapping(roster_file="data/master_roster.xlsx"):
     
     return player_team_mapping
 
+def categorize_game_keys(df_game_data):
+    """
+    Convert the team and player key columns of game data to categoricals.
+    
+    Team columns share one sorted dtype so team/opponent keys stay comparable in
+    groupbys and merges; sorted categories keep grouped output in name order.
+    
+    Args:
+        df_game_data: DataFrame with player performance data
+    
+    Returns:
+        DataFrame with categorical key columns (modified in place)
+    """
+    team_cols = [c for c in TEAM_KEY_COLS if c in df_game_data.columns]
+    if team_cols:
+        teams = pd.unique(pd.concat([df_game_data[c] for c in team_cols]).dropna())
+        team_dtype = pd.CategoricalDtype(sorted(teams))
+        for c in team_cols:
+            df_game_data[c] = df_game_data[c].astype(team_dtype)
+    if 'player' in df_game_data.columns:
+        df_game_data['player'] = df_game_data['player'].astype(
+            pd.CategoricalDtype(sorted(df_game_data['player'].dropna().unique())))
+    return df_game_data
+
+def downcast_game_stats(df_game_data):
+    """
+    Store game stat columns as float32 and week as int16 to halve their memory footprint.
+    
+    Stat values are whole-number counts, so the downcast is exact; aggregation still
+    accumulates in float64.
+    
+    Args:
+        df_game_data: DataFrame with player performance data
+    
+    Returns:
+        DataFrame with downcast stat and week columns (modified in place)
+    """
+    stat_cols = [c for c in GAME_STAT_COLS if c in df_game_data.columns]
+    if stat_cols:
+        df_game_data[stat_cols] = df_game_data[stat_cols].astype(GAME_STAT_DTYPE)
+    if 'week' in df_game_data.columns:
+        df_game_data['week'] = df_game_data['week'].astype(np.int16)
+    return df_game_data
+
 def build_team_opponents_schedule(df_game_data):
     """
     Build a team schedule mapping from player-level game data.
@@ -177,19 +290,64 @@ def build_team_opponents_schedule(df_game_data):
     # Get unique team-game combinations
     team_schedule = df_game_data[['year', 'week', 'home_team', 'away_team', 'team', 'opponent']].drop_duplicates()
     
-    # Group by team and aggregate opponents
-    team_opponents = team_schedule.groupby('team').agg({
-        'opponent': lambda x: str(list(x)),  # String representation of list for CSV compatibility
-        'week': 'count'  # Number of games played
-    }).rename(columns={'opponent': 'opps', 'week': 'games'})
-    
-    # Ensure opps is never empty - if no games, use empty list
-    team_opponents['opps'] = team_opponents['opps'].apply(
-        lambda x: "[]" if pd.isna(x) or x == "0.0" or x == 0.0 else x
-    )
+    # Group by team and aggregate opponents; opps stays a real list of abbreviations
+    # (opponent is made plain object first, since a categorical cannot hold list results)
+    team_schedule = team_schedule.astype({'opponent': object})
+    team_groups = team_schedule.groupby('team', sort=False, observed=True)
+    team_opponents = pd.DataFrame({
+        'opps': team_groups['opponent'].agg(list),
+        'games': team_groups['week'].count()  # Number of games played
+    })
     
     return team_opponents
 
+def weighted_group_means(df, keys, stat_columns, weight_col='time_weight', chunk_rows=AGG_CHUNK_ROWS):
+    """
+    Time-weighted mean of each stat column per group, reduced chunk by chunk.
+    
+    Rows are factorized to group codes once, then each chunk scatter-adds weight * stat
+    and weight into per-group accumulators with np.bincount, one column at a time, so
+    no weighted copy of the stat block is materialized and memory is bounded by the
+    number of groups rather than the number of rows.
+    
+    Args:
+        df: DataFrame with player performance data (must include weight_col)
+        keys: Column name or list of column names to group by
+        stat_columns: Stat columns to average
+        weight_col: Column holding the time weights
+        chunk_rows: Number of rows reduced per chunk
+    
+    Returns:
+        DataFrame indexed by keys (sorted) with the weighted mean of each stat (0 where weights sum to 0)
+    """
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    if len(keys) == 1:
+        group_index = pd.Index(df[keys[0]])
+    else:
+        group_index = pd.MultiIndex.from_arrays([df[k] for k in keys])
+    codes, groups = pd.factorize(group_index, sort=True)
+    n_groups = len(groups)
+    
+    weight_sum = np.zeros(n_groups)
+    totals = np.zeros((n_groups, len(stat_columns)))
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        chunk_codes = codes[start:start + chunk_rows]
+        weights = chunk[weight_col].to_numpy(dtype=np.float64)
+        # Rows with a missing key (code -1) are dropped, as groupby does
+        valid = chunk_codes >= 0
+        chunk_codes = chunk_codes[valid]
+        weights = weights[valid]
+        weight_sum += np.bincount(chunk_codes, weights=weights, minlength=n_groups)
+        values = chunk[stat_columns].to_numpy(dtype=np.float64)[valid]
+        for j in range(len(stat_columns)):
+            totals[:, j] += np.bincount(chunk_codes, weights=values[:, j] * weights, minlength=n_groups)
+    
+    means = np.divide(totals, weight_sum[:, None],
+                      out=np.zeros(totals.shape), where=weight_sum[:, None] != 0)
+    groups = groups.set_names(keys) if len(keys) > 1 else groups.rename(keys[0])
+    return pd.DataFrame(means, index=groups, columns=stat_columns)
+
 def build_team_statistics(df_game_data):
     """
     Aggregate player-level data to team-level statistics for each game with time weighting.
@@ -206,57 +364,17 @@ def build_team_statistics(df_game_data):
         DataFrame with team-level time-weighted aggregated stats per game
     """
     # Apply proper time-weighted aggregation using normalized weights
-    stat_columns = ['pass_cmp', 'pass_att', 'pass_yds', 'pass_tds', 'pass_int', 'sacks',
-                   'rush_att', 'rush_yds', 'rush_tds', 'targets', 'receptions', 'rec_yds', 'rec_tds', 'fumbles']
-    
-    def weighted_average(group, stat_col, weight_col):
-        """Calculate weighted average for a stat column using time weights"""
-        if group[weight_col].sum() == 0:
-            return 0
-        return np.average(group[stat_col], weights=group[weight_col])
+    stat_columns = GAME_STAT_COLS
     
     # Group by team, opponent, week and calculate weighted averages for offensive stats
     # These represent the team's offensive performance in each game
-    team_stats = df_game_data.groupby(['team', 'opponent', 'week']).apply(
-        lambda group: pd.Series({
-            'pass_cmp': weighted_average(group, 'pass_cmp', 'time_weight'),
-            'pass_att': weighted_average(group, 'pass_att', 'time_weight'),
-            'pass_yds': weighted_average(group, 'pass_yds', 'time_weight'),
-            'pass_tds': weighted_average(group, 'pass_tds', 'time_weight'),
-            'pass_int': weighted_average(group, 'pass_int', 'time_weight'),
-            'sacks': weighted_average(group, 'sacks', 'time_weight'),
-            'rush_att': weighted_average(group, 'rush_att', 'time_weight'),
-            'rush_yds': weighted_average(group, 'rush_yds', 'time_weight'),
-            'rush_tds': weighted_average(group, 'rush_tds', 'time_weight'),
-            'targets': weighted_average(group, 'targets', 'time_weight'),
-            'receptions': weighted_average(group, 'receptions', 'time_weight'),
-            'rec_yds': weighted_average(group, 'rec_yds', 'time_weight'),
-            'rec_tds': weighted_average(group, 'rec_tds', 'time_weight'),
-            'fumbles': weighted_average(group, 'fumbles', 'time_weight')
-        })
-    ).reset_index()
-    
-    # Calculate defensive stats by aggregating opponent's offensive performance with time weighting
-    # When we group by opponent, we're getting the opponent's offensive stats
-    # These become our defensive stats (how well we defended against them)
-    opponent_offensive_stats = df_game_data.groupby(['opponent', 'team', 'week']).apply(
-        lambda group: pd.Series({
-            'pass_cmp': weighted_average(group, 'pass_cmp', 'time_weight'),
-            'pass_att': weighted_average(group, 'pass_att', 'time_weight'),
-            'pass_yds': weighted_average(group, 'pass_yds', 'time_weight'),
-            'pass_tds': weighted_average(group, 'pass_tds', 'time_weight'),
-            'pass_int': weighted_average(group, 'pass_int', 'time_weight'),
-            'sacks': weighted_average(group, 'sacks', 'time_weight'),
-            'rush_att': weighted_average(group, 'rush_att', 'time_weight'),
-            'rush_yds': weighted_average(group, 'rush_yds', 'time_weight'),
-            'rush_tds': weighted_average(group, 'rush_tds', 'time_weight'),
-            'targets': weighted_average(group, 'targets', 'time_weight'),
-            'receptions': weighted_average(group, 'receptions', 'time_weight'),
-            'rec_yds': weighted_average(group, 'rec_yds', 'time_weight'),
-            'rec_tds': weighted_average(group, 'rec_tds', 'time_weight'),
-            'fumbles': weighted_average(group, 'fumbles', 'time_weight')
-        })
-    ).reset_index()
+    team_stats = weighted_group_means(df_game_data, ['team', 'opponent', 'week'], stat_columns).reset_index()
+    
+    # Defensive stats are the opponent's offensive stats from the same aggregation with the keys swapped:
+    # the (opponent, team, week) group is exactly the (team, opponent, week) row of the other side,
+    # so no second groupby over the player rows is needed
+    opponent_offensive_stats = team_stats.rename(columns={'team': 'opponent', 'opponent': 'team'})
+    opponent_offensive_stats = opponent_offensive_stats[['team', 'opponent', 'week'] + stat_columns]
     
     # Custom mapping: Opponent's offensive stats become our defensive stats
     # This represents how well our defense performed against the opponent's offense
@@ -278,7 +396,7 @@ def build_team_statistics(df_game_data):
     }
     
     # Rename opponent offensive columns to defensive columns using the custom mapping
-    opponent_offensive_stats.columns = ['team', 'opponent', 'week'] + [def_col_mapping[col] for col in opponent_offensive_stats.columns[3:]]
+    opponent_offensive_stats = opponent_offensive_stats.rename(columns=def_col_mapping)
     
     # Merge offensive and defensive stats
     # Now each team has both their offensive performance and their defensive performance
@@ -319,6 +437,48 @@ def determine_next_opponent(team, current_week, df_schedule):
     else:
         return next_game['Away Team']
 
+def build_next_opponents(current_week, df_schedule):
+    """
+    Determine every team's next opponent in one pass over the schedule.
+    
+    Equivalent to calling determine_next_opponent for each team: the schedule is
+    stacked into (team, opponent) rows from both the home and away side, and each
+    team's earliest game after current_week wins.
+    
+    Args:
+        current_week: Current week number
+        df_schedule: Schedule DataFrame with columns [Round Number, Away Team, Home Team]
+    
+    Returns:
+        Dict of team name -> next opponent (teams with no remaining games are absent)
+    """
+    future_games = df_schedule[df_schedule['Round Number'] > current_week]
+    sides = [
+        future_games[['Round Number', 'Away Team', 'Home Team']].set_axis(['week', 'team', 'opponent'], axis=1),
+        future_games[['Round Number', 'Home Team', 'Away Team']].set_axis(['week', 'team', 'opponent'], axis=1),
+    ]
+    # Schedule order breaks ties within a week, matching idxmin
+    team_games = pd.concat(sides).sort_index(kind='stable').sort_values('week', kind='stable')
+    next_games = team_games.drop_duplicates('team')
+    return dict(zip(next_games['team'], next_games['opponent']))
+
+def _lookup_week_weights(weeks, week_weights):
+    """
+    Map week numbers to time weights with one array gather instead of a per-row lookup.
+    
+    Args:
+        weeks: Series of integer week numbers
+        week_weights: Dict of week number -> time weight (every week in `weeks` must be present)
+    
+    Returns:
+        ndarray: Time weight for each row of `weeks`
+    """
+    if not week_weights:
+        return np.full(len(weeks), np.nan)
+    lookup = np.full(max(week_weights) + 1, np.nan)
+    lookup[list(week_weights)] = list(week_weights.values())
+    return lookup[weeks.to_numpy()]
+
 def create_time_weighted_dataset(week_2025_file, weeks_2024_file, target_weeks_2024):
     """
     Merge 2025 Week 1 with specified 2024 weeks, applying time decay weighting.
@@ -335,10 +495,10 @@ def create_time_weighted_dataset(week_2025_file, weeks_2024_file, target_weeks_2
         DataFrame with time-weighted game data including weight column
     """
     print(f"Loading 2025 Week 1 data from {week_2025_file}...")
-    df_2025 = pd.read_csv(week_2025_file)
+    df_2025 = read_game_data(week_2025_file)
     
     print(f"Loading 2024 data from {weeks_2024_file}...")
-    df_2024 = pd.read_csv(weeks_2024_file)
+    df_2024 = read_game_data(weeks_2024_file)
     
     # Filter 2024 data to target weeks
     df_2024_filtered = df_2024[df_2024['week'].isin(target_weeks_2024)].copy()
@@ -346,17 +506,9 @@ def create_time_weighted_dataset(week_2025_file, weeks_2024_file, target_weeks_2
     
     # Normalize team names to abbreviations for consistency
     # 2025 data has full team names in opponent column, 2024 data uses abbreviations
-    team_name_mapping = {
-        'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL', 'Carolina Panthers': 'CAR',
-        'Chicago Bears': 'CHI', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-        'Detroit Lions': 'DET', 'Houston Texans': 'HOU', 'Kansas City Chiefs': 'KAN',
-        'Miami Dolphins': 'MIA', 'New England Patriots': 'NWE', 'New Orleans Saints': 'NOR',
-        'New York Giants': 'NYG', 'New York Jets': 'NYJ', 'Seattle Seahawks': 'SEA',
-        'Tennessee Titans': 'TEN'
-    }
     
     # Normalize opponent column in 2025 data to use abbreviations
-    df_2025['opponent'] = df_2025['opponent'].map(team_name_mapping).fillna(df_2025['opponent'])
+    df_2025['opponent'] = df_2025['opponent'].replace(TEAM_NAME_TO_ABBREV)
     
     # Add time weights
     df_2025['time_weight'] = 1.0  # Most recent, highest weight
@@ -366,7 +518,7 @@ def create_time_weighted_dataset(week_2025_file, weeks_2024_file, target_weeks_2
     for i, week in enumerate(sorted(target_weeks_2024, reverse=True)):
         weight_map[week] = 0.9 - (i * 0.1)
     
-    df_2024_filtered['time_weight'] = df_2024_filtered['week'].map(weight_map)
+    df_2024_filtered['time_weight'] = _lookup_week_weights(df_2024_filtered['week'], weight_map)
     
     # Combine datasets
     df_combined = pd.concat([df_2025, df_2024_filtered], ignore_index=True)
@@ -375,7 +527,7 @@ def create_time_weighted_dataset(week_2025_file, weeks_2024_file, target_weeks_2
     print(f"Time weights applied: 2025 Week 1 = 1.0, 2024 weeks = {weight_map}")
     print(f"Team names normalized to abbreviations for consistency")
     
-    return df_combined
+    return categorize_game_keys(downcast_game_stats(df_combined))
 
 def create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, target_weeks_2024, projection_week):
     """
@@ -391,11 +543,29 @@ def create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, target
         DataFrame with time-weighted game data including weight column
     """
     print(f"Loading 2025 data from {week_2025_file}...")
-    df_2025 = pd.read_csv(week_2025_file)
+    df_2025 = read_game_data(week_2025_file)
     
     print(f"Loading 2024 data from {weeks_2024_file}...")
-    df_2024 = pd.read_csv(weeks_2024_file)
+    df_2024 = read_game_data(weeks_2024_file)
+    
+    return create_time_weighted_dataset_from_frames(df_2025, df_2024, target_weeks_2024, projection_week)
+
+def create_time_weighted_dataset_from_frames(df_2025, df_2024, target_weeks_2024, projection_week):
+    """
+    Create time-weighted dataset for a projection week from already loaded season data.
+    
+    Lets callers projecting many weeks (season_projector) parse the game data once and
+    slice it per week. The input frames are not modified.
     
+    Args:
+        df_2025: 2025 season game data (as returned by read_game_data)
+        df_2024: 2024 season game data (as returned by read_game_data)
+        target_weeks_2024: List of 2024 weeks to include as fallback
+        projection_week: Week number for projections (1 = Week 1, 2 = Week 2, etc.)
+    
+    Returns:
+        DataFrame with time-weighted game data including weight column
+    """
     # Determine data selection based on projection week
     if projection_week == 1:
         # Week 1 projections: Use 10 games from 2024 (no 2025 data yet)
@@ -428,18 +598,10 @@ def create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, target
     print(f"Including 2024 weeks: {weeks_to_include_2024}")
     
     # Normalize team names to abbreviations for consistency
-    team_name_mapping = {
-        'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL', 'Carolina Panthers': 'CAR',
-        'Chicago Bears': 'CHI', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-        'Detroit Lions': 'DET', 'Houston Texans': 'HOU', 'Kansas City Chiefs': 'KAN',
-        'Miami Dolphins': 'MIA', 'New England Patriots': 'NWE', 'New Orleans Saints': 'NOR',
-        'New York Giants': 'NYG', 'New York Jets': 'NYJ', 'Seattle Seahawks': 'SEA',
-        'Tennessee Titans': 'TEN'
-    }
     
     # Normalize opponent column in 2025 data to use abbreviations (only if data exists)
     if not df_2025_filtered.empty:
-        df_2025_filtered['opponent'] = df_2025_filtered['opponent'].map(team_name_mapping).fillna(df_2025_filtered['opponent'])
+        df_2025_filtered['opponent'] = df_2025_filtered['opponent'].replace(TEAM_NAME_TO_ABBREV)
     
     # Calculate time weights - most recent week gets highest weight
     all_weeks = []
@@ -460,22 +622,25 @@ def create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, target
     
     # Apply weights
     if not df_2025_filtered.empty:
-        df_2025_filtered['time_weight'] = df_2025_filtered['week'].apply(lambda w: weight_map[('2025', w)])
+        df_2025_filtered['time_weight'] = _lookup_week_weights(
+            df_2025_filtered['week'], {w: v for (yr, w), v in weight_map.items() if yr == '2025'})
     
     if not df_2024_filtered.empty:
-        df_2024_filtered['time_weight'] = df_2024_filtered['week'].apply(lambda w: weight_map[('2024', w)])
+        df_2024_filtered['time_weight'] = _lookup_week_weights(
+            df_2024_filtered['week'], {w: v for (yr, w), v in weight_map.items() if yr == '2024'})
     
     # Combine datasets
     if not df_2024_filtered.empty:
         df_combined = pd.concat([df_2025_filtered, df_2024_filtered], ignore_index=True)
     else:
-        df_combined = df_2025_filtered.copy()
+        # df_2025_filtered is already a private filtered copy, so it can be used as-is
+        df_combined = df_2025_filtered
     
     print(f"Combined dataset: {len(df_combined)} total records")
     print(f"Time weights applied: {weight_map}")
     print(f"Team names normalized to abbreviations for consistency")
     
-    return df_combined
+    return categorize_game_keys(downcast_game_stats(df_combined))
 
 def create_team_dataset_from_game_data(df_game_data, df_schedule=None, current_week=None):
     """
@@ -501,36 +666,8 @@ def create_team_dataset_from_game_data(df_game_data, df_schedule=None, current_w
     team_stats = build_team_statistics(df_game_data)
     
     # Aggregate team stats across all games (sum all stats)
-    team_aggregated = team_stats.groupby('team').agg({
-        'pass_cmp': 'sum',
-        'pass_att': 'sum',
-        'pass_yds': 'sum',
-        'pass_tds': 'sum',
-        'pass_int': 'sum',
-        'sacks': 'sum',
-        'rush_att': 'sum',
-        'rush_yds': 'sum',
-        'rush_tds': 'sum',
-        'targets': 'sum',
-        'receptions': 'sum',
-        'rec_yds': 'sum',
-        'rec_tds': 'sum',
-        'fumbles': 'sum',
-        'def_pass_cmp': 'sum',
-        'def_pass_att': 'sum',
-        'def_pass_yd': 'sum',
-        'def_pass_td': 'sum',
-        'def_int': 'sum',
-        'def_sacks': 'sum',
-        'def_rush_att': 'sum',
-        'def_rush_yd': 'sum',
-        'def_rush_td': 'sum',
-        'def_targets': 'sum',
-        'def_rec': 'sum',
-        'def_rec_yd': 'sum',
-        'def_rec_td': 'sum',
-        'def_fum': 'sum'
-    }).reset_index()
+    # Every offensive and defensive stat column is summed, so a single column-wise sum replaces the per-column agg dict
+    team_aggregated = team_stats.drop(columns=['opponent', 'week']).groupby('team', as_index=False, observed=True).sum()
     
     # Rename columns to match analyze function expectations exactly
     team_aggregated = team_aggregated.rename(columns={
@@ -549,9 +686,8 @@ def create_team_dataset_from_game_data(df_game_data, df_schedule=None, current_w
     
     # Add next opponent if schedule data is provided
     if df_schedule is not None and current_week is not None:
-        team_complete['next_op'] = team_complete['team'].apply(
-            lambda team: determine_next_opponent(team, current_week, df_schedule)
-        )
+        next_opponents = build_next_opponents(current_week, df_schedule)
+        team_complete['next_op'] = [next_opponents.get(team) for team in team_complete['team']]
     else:
         team_complete['next_op'] = None
     
@@ -584,7 +720,11 @@ def create_player_dataset_from_game_data(df_game_data, active_roster, player_tea
     print(f"Active roster size: {len(active_roster)}")
     
     # Filter game data to only include active players
-    df_filtered = df_game_data[df_game_data['player'].isin(active_roster)].copy()
+    # Membership is tested once per distinct player (category) and gathered back to rows by code;
+    # boolean indexing already returns a new frame, and df_filtered is only read from here on
+    players = df_game_data['player'].astype('category')
+    active_categories = np.append(players.cat.categories.isin(active_roster), False)  # code -1 (missing) -> False
+    df_filtered = df_game_data[active_categories[players.cat.codes.to_numpy()]]
     active_players_found = df_filtered['player'].nunique()
     
     print(f"Active players found in game data: {active_players_found}")
@@ -608,34 +748,10 @@ def create_player_dataset_from_game_data(df_game_data, active_roster, player_tea
         raise ValueError("No active players found in game data. Check name matching between roster and game data.")
     
     # Apply proper time-weighted aggregation using normalized weights
-    stat_columns = ['pass_cmp', 'pass_att', 'pass_yds', 'pass_tds', 'pass_int', 'sacks',
-                   'rush_att', 'rush_yds', 'rush_tds', 'targets', 'receptions', 'rec_yds', 'rec_tds', 'fumbles']
-    
-    def weighted_average(group, stat_col, weight_col):
-        """Calculate weighted average for a stat column using time weights"""
-        if group[weight_col].sum() == 0:
-            return 0
-        return np.average(group[stat_col], weights=group[weight_col])
+    stat_columns = GAME_STAT_COLS
     
     # Group by player and calculate weighted averages for each stat
-    player_stats = df_filtered.groupby('player').apply(
-        lambda group: pd.Series({
-            'pass_cmp': weighted_average(group, 'pass_cmp', 'time_weight'),
-            'pass_att': weighted_average(group, 'pass_att', 'time_weight'),
-            'pass_yds': weighted_average(group, 'pass_yds', 'time_weight'),
-            'pass_tds': weighted_average(group, 'pass_tds', 'time_weight'),
-            'pass_int': weighted_average(group, 'pass_int', 'time_weight'),
-            'sacks': weighted_average(group, 'sacks', 'time_weight'),
-            'rush_att': weighted_average(group, 'rush_att', 'time_weight'),
-            'rush_yds': weighted_average(group, 'rush_yds', 'time_weight'),
-            'rush_tds': weighted_average(group, 'rush_tds', 'time_weight'),
-            'targets': weighted_average(group, 'targets', 'time_weight'),
-            'receptions': weighted_average(group, 'receptions', 'time_weight'),
-            'rec_yds': weighted_average(group, 'rec_yds', 'time_weight'),
-            'rec_tds': weighted_average(group, 'rec_tds', 'time_weight'),
-            'fumbles': weighted_average(group, 'fumbles', 'time_weight')
-        })
-    ).reset_index()
+    player_stats = weighted_group_means(df_filtered, 'player', stat_columns).reset_index()
     
     # Rename columns to match analyze function expectations exactly
     player_stats = player_stats.rename(columns={
@@ -651,8 +767,9 @@ def create_player_dataset_from_game_data(df_game_data, active_roster, player_tea
     })
     
     # Count total games played (weeks) for each player across all teams
-    games_played = df_filtered.groupby('player')['week'].nunique().reset_index()
-    games_played.columns = ['player', 'g']
+    # Hash-dedup the (player, week) pairs and count rows instead of a per-group nunique
+    player_weeks = df_filtered[['player', 'week']].drop_duplicates()
+    games_played = player_weeks.groupby('player', sort=False, observed=True, as_index=False).size().rename(columns={'size': 'g'})
     
     # Merge stats with games played
     player_complete = pd.merge(player_stats, games_played, on='player', how='left')
@@ -699,230 +816,310 @@ def create_player_dataset_from_game_data(df_game_data, active_roster, player_tea
     # Keep name as a regular column - let analyze function handle index management
     return player_complete
 
+def _parse_opps(opps):
+    """
+    Normalize one team's opps entry to a list of opponent abbreviations.
+    
+    Args:
+        opps: A list, an OPPS_SEP-joined string, an older "['ATL', 'BAL']" string, or missing
+    
+    Returns:
+        list: Opponents played (empty when missing)
+    """
+    if isinstance(opps, list):
+        return opps
+    if not isinstance(opps, str) or not opps:
+        return []
+    if opps.startswith('['):
+        # Team CSVs written before the OPPS_SEP format hold the repr of a list
+        return list(ast.literal_eval(opps))
+    return opps.split(OPPS_SEP)
+
+def _safe_divide(numerator, denominator):
+    """
+    Element-wise division that returns 0 wherever the denominator is 0.
+    
+    Args:
+        numerator: Array-like numerator
+        denominator: Array-like denominator (broadcast against numerator)
+    
+    Returns:
+        np.ndarray: Quotient with 0 in place of inf/NaN from zero denominators
+    """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+def _take_by_code(values, codes, fill_value=np.nan):
+    """
+    Gather values (or rows of a 2-D block) by categorical codes, using fill_value where the code is -1.
+    
+    Args:
+        values: Array indexed along axis 0 by category position
+        codes: Integer codes (e.g., pd.Categorical(...).codes)
+        fill_value: Value for codes of -1 (unknown category)
+    
+    Returns:
+        np.ndarray: values[codes] with fill_value for unknown categories
+    """
+    values = np.asarray(values, dtype=np.float64)
+    known = (codes >= 0).reshape((-1,) + (1,) * (values.ndim - 1))
+    return np.where(known, values[np.maximum(codes, 0)], fill_value)
+
+def _project_rate_stat(driver, per_att, sched, opp):
+    """
+    Projection kernel: driver * (per_att / sched) * opp over float arrays.
+    
+    Writes into a single output buffer instead of allocating a temporary per operation.
+    Zero schedule strength yields inf/NaN, which the caller cleans up.
+    
+    Args:
+        driver: Projected attempts (pass att, rush att, targets) per player
+        per_att: Player's stat per attempt
+        sched: Player's own-team schedule strength for the stat
+        opp: Next opponent's ratio for the stat
+    
+    Returns:
+        np.ndarray: Projected stat per player
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = np.divide(per_att, sched)
+    out *= driver
+    out *= opp
+    return out
+
+def _zero_non_finite(df):
+    """
+    Replace NaN and +/-inf with 0 in the float columns of a frame in one pass.
+    
+    Args:
+        df: DataFrame to clean (modified in place)
+    
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    float_cols = df.select_dtypes(include=[np.floating]).columns
+    df[float_cols] = np.nan_to_num(df[float_cols].to_numpy(), nan=0.0, posinf=0.0, neginf=0.0)
+    return df
+
 def analyze(df_team, df_players, projection_week=1):
     """
         SETUP DATAFRAMES
             Fill any empty cells
             Determine Number of Games Played By Each Team's Schedule
     """
-    df_team = df_team.fillna(0.0)
-    df_players = df_players.fillna(0.0)
-    df_team_avg = df_team.copy()
-    df_team_avg.set_index("team", inplace=True)
-    df_team_avg.index.name="team"
-    # Handle NaN values in opps column before applying literal_eval
-    df_team_avg['opps'] = df_team_avg['opps'].fillna("[]")
-    # Also handle any 0.0 values that might have been created
-    df_team_avg['opps'] = df_team_avg['opps'].replace(0.0, "[]")
-    df_team_avg['opps'] = df_team_avg['opps'].apply(ast.literal_eval)
-    df_team_avg['games'] = df_team_avg['opps'].apply(len)
+    # set_index already returns a new frame (named "team"), so no defensive copy is needed;
+    # empty stat cells are zeroed on the stat matrix below instead of filling every column here
+    df_team_avg = df_team.set_index("team")
+    # opps arrive as lists from create_team_dataset_from_game_data, or as strings from a saved CSV
+    df_team_avg['opps'] = [_parse_opps(opps) for opps in df_team_avg['opps']]
+    # games comes from build_team_opponents_schedule (one per opps entry); only older tables lack it
+    if 'games' in df_team_avg.columns:
+        df_team_avg['games'] = df_team_avg['games'].fillna(0)
+    else:
+        df_team_avg['games'] = df_team_avg['opps'].str.len()
 
     """
       LEAGUE SUMS - 
         We will want to compare each team to the league average
         Based on position against league average we can normalize our projections w/ matchup strength
     """
-    num_games = df_team_avg["games"].sum()
-    num_rush_att = df_team_avg["rush_att"].sum()
-    num_pass_att = df_team_avg["pass_att"].sum()
-    num_def_rush_att = df_team_avg["def_rush_att"].sum()
-    num_def_pass_att = df_team_avg["def_pass_att"].sum()
+    # Team stat math runs on a dense float matrix (teams x stats) and is written back to the frame once
+    col = {name: i for i, name in enumerate(TEAM_STAT_COLS)}
+    arr = df_team_avg[TEAM_STAT_COLS].to_numpy(dtype=np.float64, copy=True)
+    arr[np.isnan(arr)] = 0.0
+    games = df_team_avg["games"].to_numpy(dtype=np.float64)
+    totals = arr.sum(axis=0)
+
+    num_games = games.sum()
+    num_rush_att = totals[col["rush_att"]]
+    num_pass_att = totals[col["pass_att"]]
+    num_def_rush_att = totals[col["def_rush_att"]]
+    num_def_pass_att = totals[col["def_pass_att"]]
 
     # CALCULATE LEAGUE ATT AVG
-    avg_dict = {}
-    avg_dict["league"] = [
-        df_team_avg["pass_cmp"].sum() / num_games,
-        df_team_avg["pass_att"].sum() / num_games,
-                          df_team_avg["pass_yd"].sum() / num_pass_att,
-                          df_team_avg["pass_td"].sum() / num_pass_att,
-                          df_team_avg["pass_int"].sum() / num_pass_att,
-        df_team_avg["sacks"].sum() / num_games,
-                          df_team_avg["rush_att"].sum() / num_games,
-                          df_team_avg["rush_yd"].sum() / num_rush_att,
-                          df_team_avg["rush_td"].sum() / num_rush_att,
-        df_team_avg["targets"].sum() / num_pass_att,
-        df_team_avg["rec"].sum() / num_pass_att,
-                          df_team_avg["rec_yd"].sum() / num_pass_att,
-                          df_team_avg["rec_td"].sum() / num_pass_att,
-                          df_team_avg["off_fum"].sum() / (num_pass_att + num_rush_att),
-        df_team_avg["def_pass_cmp"].sum() / num_games,
-                          df_team_avg["def_pass_att"].sum() / num_games,
-                          df_team_avg["def_pass_yd"].sum() / num_def_pass_att,
-                          df_team_avg["def_pass_td"].sum() / num_def_pass_att,
-                          df_team_avg["def_int"].sum() / num_def_pass_att,
-        df_team_avg["def_sacks"].sum() / num_games,
-                          df_team_avg["def_rush_att"].sum() / num_games,
-                          df_team_avg["def_rush_yd"].sum() / num_def_rush_att,
-                          df_team_avg["def_rush_td"].sum() / num_def_rush_att,
-        df_team_avg["def_targets"].sum() / num_def_pass_att,
-        df_team_avg["def_rec"].sum() / num_def_pass_att,
-                          df_team_avg["def_rec_yd"].sum() / num_def_pass_att,
-                          df_team_avg["def_rec_td"].sum() / num_def_pass_att,
-                          df_team_avg["def_fum"].sum() / (num_def_pass_att + num_def_rush_att)]
-    df_leag_avg = pd.DataFrame.from_dict(avg_dict, orient="index", columns=[(df_team_avg.columns)[0:28]])
+    league_denoms = {
+        "pass_cmp": num_games, "pass_att": num_games,
+        "pass_yd": num_pass_att, "pass_td": num_pass_att, "pass_int": num_pass_att,
+        "sacks": num_games, "rush_att": num_games,
+        "rush_yd": num_rush_att, "rush_td": num_rush_att,
+        "targets": num_pass_att, "rec": num_pass_att, "rec_yd": num_pass_att, "rec_td": num_pass_att,
+        "off_fum": num_pass_att + num_rush_att,
+        "def_pass_cmp": num_games, "def_pass_att": num_games,
+        "def_pass_yd": num_def_pass_att, "def_pass_td": num_def_pass_att, "def_int": num_def_pass_att,
+        "def_sacks": num_games, "def_rush_att": num_games,
+        "def_rush_yd": num_def_rush_att, "def_rush_td": num_def_rush_att,
+        "def_targets": num_def_pass_att, "def_rec": num_def_pass_att,
+        "def_rec_yd": num_def_pass_att, "def_rec_td": num_def_pass_att,
+        "def_fum": num_def_pass_att + num_def_rush_att,
+    }
+    league_avg = _safe_divide(totals, np.array([league_denoms[name] for name in TEAM_STAT_COLS]))
+    df_leag_avg = pd.Series(league_avg, index=TEAM_STAT_COLS, name="league")
 
     # CALCULATE AVG TEAM STAT PER ATT - Fantasy is largely dependent on attempts made by player & opportunity provided by teams
+    # Divisions by zero yield 0 instead of inf/NaN, so the matrix only needs one cleanup pass at the end
+    pass_att = arr[:, col["pass_att"]].copy()
+    rush_att = _safe_divide(arr[:, col["rush_att"]], games)
+    def_pass_att = arr[:, col["def_pass_att"]].copy()
+    def_rush_att = arr[:, col["def_rush_att"]].copy()
 
     # PASSING
-    df_team_avg['pass_cmp'] = df_team_avg['pass_cmp'] / df_team_avg['pass_att']
-    df_team_avg['pass_yd'] = df_team_avg['pass_yd'] / df_team_avg['pass_att']
-    df_team_avg['pass_td'] = df_team_avg['pass_td'] / df_team_avg['pass_att']
-    df_team_avg['pass_int'] = df_team_avg['pass_int'] / df_team_avg['pass_att']
-    df_team_avg['sacks'] = df_team_avg['sacks'] / df_team_avg['games']
-    # RUSHING
-    df_team_avg['rush_att'] = df_team_avg["rush_att"] / df_team_avg['games']
-    df_team_avg['rush_yd'] = df_team_avg["rush_yd"] / df_team_avg['rush_att'].replace(0, 0.0001)
-    df_team_avg['rush_td'] = df_team_avg["rush_td"] / df_team_avg['rush_att'].replace(0, 0.0001)
-    # RECEIVING
-    df_team_avg['targets'] = df_team_avg["targets"] / df_team_avg['pass_att'].replace(0, 0.0001)
-    df_team_avg['rec'] = df_team_avg["rec"] / df_team_avg['targets'].replace(0, 0.0001)
-    df_team_avg['rec_yd'] = df_team_avg["rec_yd"] / df_team_avg['pass_att'].replace(0, 0.0001)
-    df_team_avg['rec_td'] = df_team_avg["rec_td"] / df_team_avg['pass_att'].replace(0, 0.0001)
-    df_team_avg['off_fum'] = df_team_avg["off_fum"] / (df_team_avg['pass_att'] + df_team_avg['rush_att']).replace(0, 0.0001)
+    for name in ("pass_cmp", "pass_yd", "pass_td", "pass_int"):
+        arr[:, col[name]] = _safe_divide(arr[:, col[name]], pass_att)
+    arr[:, col["sacks"]] = _safe_divide(arr[:, col["sacks"]], games)
+    # RUSHING - yards and TDs are taken per per-game rush attempt
+    arr[:, col["rush_yd"]] = _safe_divide(arr[:, col["rush_yd"]], rush_att)
+    arr[:, col["rush_td"]] = _safe_divide(arr[:, col["rush_td"]], rush_att)
+    # RECEIVING - receptions are taken per target rate
+    arr[:, col["targets"]] = _safe_divide(arr[:, col["targets"]], pass_att)
+    arr[:, col["rec"]] = _safe_divide(arr[:, col["rec"]], arr[:, col["targets"]])
+    arr[:, col["rec_yd"]] = _safe_divide(arr[:, col["rec_yd"]], pass_att)
+    arr[:, col["rec_td"]] = _safe_divide(arr[:, col["rec_td"]], pass_att)
+    arr[:, col["off_fum"]] = _safe_divide(arr[:, col["off_fum"]], pass_att + rush_att)
     # OFF ATT
-    df_team_avg['pass_att'] = df_team_avg["pass_att"] / df_team_avg['games']
-    df_team_avg['rush_att'] = df_team_avg["rush_att"] / df_team_avg['games']
+    arr[:, col["pass_att"]] = _safe_divide(pass_att, games)
+    arr[:, col["rush_att"]] = _safe_divide(rush_att, games)
 
     # DEF PASSING
-    df_team_avg['def_pass_cmp'] = df_team_avg['def_pass_cmp'] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_pass_yd'] = df_team_avg['def_pass_yd'] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_pass_td'] = df_team_avg['def_pass_td'] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_int'] = df_team_avg['def_int'] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_sacks'] = df_team_avg['def_sacks'] / df_team_avg['games']
+    for name in ("def_pass_cmp", "def_pass_yd", "def_pass_td", "def_int"):
+        arr[:, col[name]] = _safe_divide(arr[:, col[name]], def_pass_att)
+    arr[:, col["def_sacks"]] = _safe_divide(arr[:, col["def_sacks"]], games)
     # DEF RUSHING
-    df_team_avg['def_rush_yd'] = df_team_avg["def_rush_yd"] / df_team_avg['def_rush_att'].replace(0, 0.0001)
-    df_team_avg['def_rush_td'] = df_team_avg["def_rush_td"] / df_team_avg['def_rush_att'].replace(0, 0.0001)
+    arr[:, col["def_rush_yd"]] = _safe_divide(arr[:, col["def_rush_yd"]], def_rush_att)
+    arr[:, col["def_rush_td"]] = _safe_divide(arr[:, col["def_rush_td"]], def_rush_att)
     # DEF RECEIVING
-    df_team_avg['def_targets'] = df_team_avg["def_targets"] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_rec'] = df_team_avg["def_rec"] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_rec_yd'] = df_team_avg["def_rec_yd"] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_rec_td'] = df_team_avg["def_rec_td"] / df_team_avg['def_pass_att'].replace(0, 0.0001)
-    df_team_avg['def_fum'] = df_team_avg["def_fum"] / (df_team_avg['def_pass_att'] + df_team_avg['def_rush_att']).replace(0, 0.0001)
+    for name in ("def_targets", "def_rec", "def_rec_yd", "def_rec_td"):
+        arr[:, col[name]] = _safe_divide(arr[:, col[name]], def_pass_att)
+    arr[:, col["def_fum"]] = _safe_divide(arr[:, col["def_fum"]], def_pass_att + def_rush_att)
     # DEF ATT
-    df_team_avg['def_pass_att'] = df_team_avg["def_pass_att"] / df_team_avg['games']
-    df_team_avg['def_rush_att'] = df_team_avg["def_rush_att"] / df_team_avg['games']
-    
+    arr[:, col["def_pass_att"]] = _safe_divide(def_pass_att, games)
+    arr[:, col["def_rush_att"]] = _safe_divide(def_rush_att, games)
+
     # Clean up team statistics calculations - replace any NaN or infinite values with 0
-    df_team_avg = df_team_avg.replace([np.inf, -np.inf], 0)
-    df_team_avg = df_team_avg.fillna(0)
+    arr = np.nan_to_num(arr, nan=0.0, posinf=0.0, neginf=0.0)
+    df_team_avg[TEAM_STAT_COLS] = arr
 
     # CALCULATE TEAM RATIOS TO LEAGUE ATT AVG
     
-    # Offense Stats in first 29 cols - Comparison of Each Team in the League against League Avg
-    for col in (df_team_avg.columns)[0:28]:
-        stat = df_leag_avg.loc["league", col]
-        # Prevent divide by zero - replace 0 with 0.0001 to avoid infinite values
-        stat_value = stat.values[0] if stat.values[0] != 0 else 0.0001
-        df_team_avg[f"ratio_{col}"] = df_team_avg[col] / stat_value
+    # Offense and Defense Stats - Comparison of Each Team in the League against League Avg
+    # Prevent divide by zero - replace 0 with 0.0001 to avoid infinite values
+    league_divisor = np.where(league_avg != 0, league_avg, 0.0001)
+    df_team_avg[RATIO_COLS] = arr / league_divisor
     
-    # Clean up any infinite values that may have been created
-    df_team_avg = df_team_avg.replace([np.inf, -np.inf], 0)
-
     # CALCULATE SCHEDULE STRENGTH PER STAT - Comparison of Each Team in the League agsinst League Avg
-    for col in (df_team_avg.columns)[31:59]:
-        df_team_avg[f"schedstr_{col}"] = df_team_avg.apply(lambda row: calc_matchup_str(row, col, df_team_avg), axis=1)
+    df_team_avg[[f"schedstr_{ratio_col}" for ratio_col in RATIO_COLS]] = calc_matchup_str(df_team_avg, RATIO_COLS).to_numpy()
     
-    # Clean up schedule strength calculations - replace any NaN or infinite values with 0
-    df_team_avg = df_team_avg.fillna(0)
-    df_team_avg = df_team_avg.replace([np.inf, -np.inf], 0)
+    # Clean up ratio and schedule strength calculations - replace any NaN or infinite values with 0
+    _zero_non_finite(df_team_avg)
 
     """
         PLAYERS DATA
     """
     # SETUP DATA
-    df_player_avg = df_players.copy()
+    df_player_avg = df_players.fillna(0.0)
     df_player_avg.set_index("name", inplace=True)
     df_player_avg.index.name="name"
     num_games = df_player_avg["g"].sum()
 
     # CALCULATE AVERAGE PLAYER STAT PER ATT
-    # PASS
-    df_player_avg["pass_cmp"] = df_player_avg["pass_cmp"] / df_player_avg["pass_att"].replace(0, 0.0001)
-    df_player_avg["pass_yd"] = df_player_avg["pass_yd"] / df_player_avg["pass_att"].replace(0, 0.0001)
-    df_player_avg["pass_td"] = df_player_avg["pass_td"] / df_player_avg["pass_att"].replace(0, 0.0001)
-    df_player_avg["pass_int"] = df_player_avg["pass_int"] / df_player_avg["pass_att"].replace(0, 0.0001)
-    # RUSH
-    df_player_avg["rush_yd"] = df_player_avg["rush_yd"] / df_player_avg["rush_att"].replace(0, 0.0001)
-    df_player_avg["rush_td"] = df_player_avg["rush_td"] / df_player_avg["rush_att"].replace(0, 0.0001)
-    # REC
-    df_player_avg["rec"] = df_player_avg["rec"] / df_player_avg["tar"].replace(0, 0.0001)
-    df_player_avg["rec_yd"] = df_player_avg["rec_yd"] / df_player_avg["tar"].replace(0, 0.0001)
-    df_player_avg["rec_td"] = df_player_avg["rec_td"] / df_player_avg["tar"].replace(0, 0.0001)
-    df_player_avg["fum"] = df_player_avg["fum"] / (df_player_avg["tar"] + df_player_avg["rush_att"]).replace(0, 0.0001)
+    # Each group of rate stats is one masked matrix divide; a zero denominator yields 0 rather than inf/NaN
+    pass_att = df_player_avg["pass_att"].to_numpy(dtype=np.float64)
+    rush_att = df_player_avg["rush_att"].to_numpy(dtype=np.float64)
+    tar = df_player_avg["tar"].to_numpy(dtype=np.float64)
+    touches = tar + rush_att
+    for rate_cols, attempts in (
+        (["pass_cmp", "pass_yd", "pass_td", "pass_int"], pass_att),  # PASS
+        (["rush_yd", "rush_td"], rush_att),                           # RUSH
+        (["rec", "rec_yd", "rec_td"], tar),                           # REC
+        (["fum"], touches),
+    ):
+        df_player_avg[rate_cols] = _safe_divide(df_player_avg[rate_cols].to_numpy(dtype=np.float64), attempts[:, None])
     # ATTS - Note: pass_att, rush_att, and tar are already per-game averages from weighted aggregation
     # No need to divide by games since create_player_dataset_from_game_data() now provides per-game weighted averages
-    df_player_avg["tar"] = df_player_avg["tar"]  # Already per-game average
-    df_player_avg["pass_att"] = df_player_avg["pass_att"]  # Already per-game average  
-    df_player_avg["rush_att"] = df_player_avg["rush_att"]  # Already per-game average
     
     # Clean up any infinite values that may have been created
-    df_player_avg = df_player_avg.replace([np.inf, -np.inf], 0)
-    df_player_avg = df_player_avg.fillna(0)
+    _zero_non_finite(df_player_avg)
 
     # CALCULATE PLAYER CORE STRENGTH STATS
     # Core Strength - Baseline Stats from a Player Based on Attempts & Strength of Schedule
     # Ex. Normalize Data by Taking Average Pass Attempts from the Player, Compare this to the Avg Pass Attempts of the League...
     # ...if the player has been attempting less pass attempts but have been facing the best NFL defenses then their actual average against the "league average team"...
     # ...can be predicted to be higher than their current stats
-    df_player_proj = df_player_avg.copy().round(2)
-    df_player_proj["core_pass_att"] = df_player_proj.apply(lambda row: (row["pass_att"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_att"]), axis=1)
-    df_player_proj["core_rush_att"] = df_player_proj.apply(lambda row: (row["rush_att"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rush_att"]), axis=1)
-    df_player_proj["core_tar"] = df_player_proj.apply(lambda row: (row["tar"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_att"]), axis=1)
+    df_player_proj = df_player_avg.round(2)
+    # Players' teams as codes into the team table, so every per-team lookup is an integer gather
+    team_categories = df_team_avg.index.astype(object)
+    team_codes = pd.Categorical(df_player_proj["team"], categories=team_categories).codes
+    
+    # Own-team schedule strength per player - every denominator gathered in one block, keyed by stat
+    sched_stats = ("def_pass_att", "def_rush_att", "def_pass_yd", "def_pass_td", "def_int", "def_rush_yd",
+                   "def_rush_td", "def_rec", "def_rec_yd", "def_rec_td", "def_fum")
+    sched_block = _take_by_code(df_team_avg[[f"schedstr_ratio_{stat_name}" for stat_name in sched_stats]].to_numpy(), team_codes)
+    sched = dict(zip(sched_stats, sched_block.T))
+    df_player_proj["core_pass_att"] = df_player_proj["pass_att"] / sched["def_pass_att"]
+    df_player_proj["core_rush_att"] = df_player_proj["rush_att"] / sched["def_rush_att"]
+    df_player_proj["core_tar"] = df_player_proj["tar"] / sched["def_pass_att"]
 
-    df_player_proj["core_pass_yd"] = df_player_proj.apply(lambda row: (row["core_pass_att"]) * (row["pass_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_yd"]), axis=1)
-    df_player_proj["core_pass_td"] = df_player_proj.apply(lambda row: (row["core_pass_att"]) * (row["pass_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_td"]), axis=1)
-    df_player_proj["core_int"] = df_player_proj.apply(lambda row: (row["core_pass_att"]) * (row["pass_int"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_int"]), axis=1)
-    df_player_proj["core_rush_yd"] = df_player_proj.apply(lambda row: (row["core_rush_att"]) * (row["rush_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rush_yd"]), axis=1)
-    df_player_proj["core_rush_td"] = df_player_proj.apply(lambda row: (row["core_rush_att"]) * (row["rush_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rush_td"]), axis=1)
-    df_player_proj["core_rec"] = df_player_proj.apply(lambda row: (row["core_tar"]) * (row["rec"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec"]) , axis=1)
-    df_player_proj["core_rec_yd"] = df_player_proj.apply(lambda row: (row["core_tar"]) * (row["rec_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec_yd"]), axis=1)
-    df_player_proj["core_rec_td"] = df_player_proj.apply(lambda row: (row["core_tar"]) * (row["rec_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec_td"]), axis=1)
-    df_player_proj["core_fum"] = df_player_proj.apply(lambda row: (row["core_tar"] + row["core_rush_att"]) * (row["fum"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_fum"]), axis=1)
+    df_player_proj["core_pass_yd"] = df_player_proj["core_pass_att"] * (df_player_proj["pass_yd"] / sched["def_pass_yd"])
+    df_player_proj["core_pass_td"] = df_player_proj["core_pass_att"] * (df_player_proj["pass_td"] / sched["def_pass_td"])
+    df_player_proj["core_int"] = df_player_proj["core_pass_att"] * (df_player_proj["pass_int"] / sched["def_int"])
+    df_player_proj["core_rush_yd"] = df_player_proj["core_rush_att"] * (df_player_proj["rush_yd"] / sched["def_rush_yd"])
+    df_player_proj["core_rush_td"] = df_player_proj["core_rush_att"] * (df_player_proj["rush_td"] / sched["def_rush_td"])
+    df_player_proj["core_rec"] = df_player_proj["core_tar"] * (df_player_proj["rec"] / sched["def_rec"])
+    df_player_proj["core_rec_yd"] = df_player_proj["core_tar"] * (df_player_proj["rec_yd"] / sched["def_rec_yd"])
+    df_player_proj["core_rec_td"] = df_player_proj["core_tar"] * (df_player_proj["rec_td"] / sched["def_rec_td"])
+    df_player_proj["core_fum"] = (df_player_proj["core_tar"] + df_player_proj["core_rush_att"]) * (df_player_proj["fum"] / sched["def_fum"])
     
     # Clean up core strength calculations - replace any NaN or infinite values with 0
-    df_player_proj = df_player_proj.replace([np.inf, -np.inf], 0)
-    df_player_proj = df_player_proj.fillna(0)
+    _zero_non_finite(df_player_proj)
     
     
     # CALCULATE PLAYER PROJ STRENGTH STATS
     # Based on the core strength of a player, looking ahead to next game and how that team does against league average project the amount of stats
     # If a player's run strength is above league average and they are playing a low ranking rush defense, we will estimate them at a higher projection.
     
-    def safe_get_opponent_ratio(row, stat_name):
-        """Safely get opponent ratio, handling missing or invalid next_op values"""
-        try:
-            next_opponent = df_team_avg.loc[row["team"], "next_op"]
-            if pd.isna(next_opponent) or next_opponent == 0.0 or next_opponent == '':
-                return 1.0  # Default to league average if no opponent
-            return df_team_avg.loc[next_opponent, stat_name]
-        except (KeyError, TypeError):
-            return 1.0  # Default to league average if lookup fails
-    
-    df_player_proj["proj_pass_att"] = df_player_proj.apply(lambda row: (row["core_pass_att"]) * safe_get_opponent_ratio(row, "ratio_def_pass_att"), axis=1)
-    df_player_proj["proj_rush_att"] = df_player_proj.apply(lambda row: (row["core_rush_att"]) * safe_get_opponent_ratio(row, "ratio_def_rush_att"), axis=1)
-    df_player_proj["proj_tar"] = df_player_proj.apply(lambda row: (row["core_tar"]) * safe_get_opponent_ratio(row, "ratio_def_pass_att"), axis=1)
+    # Next opponent's ratios for every player in one pass - players whose team or next opponent
+    # is missing or unknown fall back to 1.0 (league average)
+    next_opponent = np.where(team_codes >= 0, df_team_avg["next_op"].to_numpy()[np.maximum(team_codes, 0)], None)
+    opp_codes = pd.Categorical(next_opponent, categories=team_categories).codes
+    opp_stats = ("ratio_def_pass_att", "ratio_def_rush_att", "ratio_def_pass_yd", "ratio_def_pass_td",
+                 "ratio_def_int", "ratio_def_rush_yd", "ratio_def_rush_td", "ratio_def_rec",
+                 "ratio_def_rec_yd", "ratio_def_rec_td", "def_fum")
+    opp_block = _take_by_code(df_team_avg[list(opp_stats)].to_numpy(), opp_codes, fill_value=1.0)
+    opp_ratio = dict(zip(opp_stats, opp_block.T))
+    
+    # Projections are collected as arrays and joined onto the frame in one concat
+    projections = {
+        "proj_pass_att": df_player_proj["core_pass_att"].to_numpy() * opp_ratio["ratio_def_pass_att"],
+        "proj_rush_att": df_player_proj["core_rush_att"].to_numpy() * opp_ratio["ratio_def_rush_att"],
+        "proj_tar": df_player_proj["core_tar"].to_numpy() * opp_ratio["ratio_def_pass_att"],
+    }
 
-    df_player_proj["proj_pass_yd"] = df_player_proj.apply(lambda row: (row["proj_pass_att"]) * (row["pass_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_yd"]) * safe_get_opponent_ratio(row, "ratio_def_pass_yd"), axis=1)
-    df_player_proj["proj_pass_td"] = df_player_proj.apply(lambda row: (row["proj_pass_att"]) * (row["pass_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_pass_td"]) * safe_get_opponent_ratio(row, "ratio_def_pass_td"), axis=1)
-    df_player_proj["proj_int"] = df_player_proj.apply(lambda row: (row["proj_pass_att"]) * (row["pass_int"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_int"]) * safe_get_opponent_ratio(row, "ratio_def_int"), axis=1)
-    df_player_proj["proj_rush_yd"] = df_player_proj.apply(lambda row: (row["proj_rush_att"]) * (row["rush_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rush_yd"]) * safe_get_opponent_ratio(row, "ratio_def_rush_yd"), axis=1)
-    df_player_proj["proj_rush_td"] = df_player_proj.apply(lambda row: (row["proj_rush_att"]) * (row["rush_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rush_td"]) * safe_get_opponent_ratio(row, "ratio_def_rush_td"), axis=1)
-    df_player_proj["proj_rec"] = df_player_proj.apply(lambda row: (row["proj_tar"]) * (row["rec"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec"]) * safe_get_opponent_ratio(row, "ratio_def_rec"), axis=1)
-    df_player_proj["proj_rec_yd"] = df_player_proj.apply(lambda row: (row["proj_tar"]) * (row["rec_yd"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec_yd"]) * safe_get_opponent_ratio(row, "ratio_def_rec_yd"), axis=1)
-    df_player_proj["proj_rec_td"] = df_player_proj.apply(lambda row: (row["proj_tar"]) * (row["rec_td"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_rec_td"]) * safe_get_opponent_ratio(row, "ratio_def_rec_td"), axis=1)
-    df_player_proj["proj_fum"] = df_player_proj.apply(lambda row: (row["proj_tar"] + row["proj_rush_att"]) * (row["fum"] / df_team_avg.loc[row["team"], "schedstr_ratio_def_fum"]) * safe_get_opponent_ratio(row, "def_fum"), axis=1)
+    # Remaining projections run through one NumPy kernel on raw float arrays (no index alignment),
+    # in PROJ_DTYPE - values are rounded to 2 decimals on save, well inside float32 precision
+    sched_proj = dict(zip(sched_stats, sched_block.T.astype(PROJ_DTYPE)))
+    opp_proj = dict(zip(opp_stats, opp_block.T.astype(PROJ_DTYPE)))
+    for out_col, driver_cols, stat_col, sched_stat, opp_stat in PROJ_RATE_STATS:
+        driver = projections[driver_cols[0]].astype(PROJ_DTYPE)
+        for extra_col in driver_cols[1:]:
+            driver = driver + projections[extra_col].astype(PROJ_DTYPE)
+        projections[out_col] = _project_rate_stat(driver, df_player_proj[stat_col].to_numpy(dtype=PROJ_DTYPE),
+                                                  sched_proj[sched_stat], opp_proj[opp_stat]).astype(np.float64)
+    df_player_proj = pd.concat([df_player_proj, pd.DataFrame(projections, index=df_player_proj.index)], axis=1)
     
     # Final cleanup - replace any NaN or infinite values with 0 before rounding
-    df_player_proj = df_player_proj.replace([np.inf, -np.inf], 0)
-    df_player_proj = df_player_proj.fillna(0)
+    _zero_non_finite(df_player_proj)
     
-    # Round and save
-    df_round = df_player_proj.round(2)
+    # Round and save - only the float columns need rounding
+    float_cols = df_player_proj.select_dtypes(include=[np.floating]).columns
+    df_player_proj[float_cols] = df_player_proj[float_cols].round(2)
+    df_round = df_player_proj
     
     # Create projections directory if it doesn't exist
-    import os
     projections_dir = "data/projections"
-    os.makedirs(projections_dir, exist_ok=True)
+    if projections_dir not in _ready_dirs:
+        os.makedirs(projections_dir, exist_ok=True)
+        _ready_dirs.add(projections_dir)
     
     # Generate filename based on projection week
     filename = f"nfl25_proj_week{projection_week}.csv"
@@ -930,21 +1127,45 @@ def analyze(df_team, df_players, projection_week=1):
     
     df_round.to_csv(filepath, index="name")
     print(f"Saved projections to: {filepath}")
+    
+    return df_round
 
-def calc_matchup_str(row, stat, df):
+def calc_matchup_str(df, stats):
     """
         Based on amount of games played determine matchup strength
         Need to locate team and find their DEFENSE stats against the players off stats
+        Gathers every opponent's stats into one flat block and sums each team's segment with np.add.reduceat
     """
-    stat_agg = 0
-    for team in row["opps"]:
-        stat_agg = stat_agg + df.loc[team, stat]
+    opponents = df["opps"].explode().dropna()
+    opp_pos = df.index.get_indexer(opponents)
+    if (opp_pos < 0).any():
+        raise KeyError(f"Opponents not in team table: {sorted(set(opponents[opp_pos < 0]))}")
+    
+    # Segment offsets into the flat opponent block - explode keeps each team's opponents contiguous
+    lengths = np.array([len(opps) for opps in df["opps"]], dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    played = lengths > 0
+    
+    stat_agg = np.zeros((len(df), len(stats)))
+    if played.any():
+        opp_stats = df[stats].to_numpy(dtype=np.float64)[opp_pos]
+        stat_agg[played] = np.add.reduceat(opp_stats, offsets[played], axis=0)
     
     # Prevent divide by zero - if no games played, return 0
-    if row["games"] == 0:
-        return 0
+    games = df["games"].to_numpy(dtype=np.float64)[:, None]
+    return pd.DataFrame(_safe_divide(stat_agg, games), index=df.index, columns=stats)
+
+def read_dataset_csv(csv_file):
+    """
+    Read a saved team/player dataset CSV, reusing a parsed pickle sidecar when it is current.
+    
+    Args:
+        csv_file: Path to the dataset CSV (e.g., 'nfl25_team.csv')
     
-    return stat_agg / row["games"]
+    Returns:
+        DataFrame: Parsed dataset, equivalent to pd.read_csv(csv_file, index_col=0)
+    """
+    return read_with_sidecar(csv_file, lambda path: pd.read_csv(path, index_col=0))
 
 def run():
     """
@@ -960,8 +1181,8 @@ def run():
     
     # Try to load existing team and player data first
     try:
-        df_team = pd.read_csv("nfl25_team.csv", index_col=0)
-        df_players = pd.read_csv("nfl25_players.csv", index_col=0)
+        df_team = read_dataset_csv("nfl25_team.csv")
+        df_players = read_dataset_csv("nfl25_players.csv")
         print("Loaded existing team and player data files")
     except FileNotFoundError:
         print("Existing data files not found. Please run with game data to create new datasets.")
@@ -989,13 +1210,12 @@ def run_with_time_weighted_data(week_2025_file, weeks_2024_file, target_weeks_20
         current_week: Current week number for determining next opponent (optional)
         roster_file: Path to the active roster Excel file (default: 'data/master_roster.xlsx')
     """
-    # Set global current week parameter for filename generation
-    global current_week_param
-    current_week_param = current_week if current_week is not None else 1
+    # Week used for the next-opponent lookup and the projection filename (passed to analyze explicitly)
+    current_week = current_week if current_week is not None else 1
     
     start = dt.now()
     print(f"\nProjection Program Start with Time-Weighted Data - {start}:\n")
-    print(f"Generating projections for Week {current_week_param}")
+    print(f"Generating projections for Week {current_week}")
     print(f"Using time-weighted data with decay weighting\n")
     
     # Load active roster and player team mapping (excluding injured players)
@@ -1004,7 +1224,7 @@ def run_with_time_weighted_data(week_2025_file, weeks_2024_file, target_weeks_20
     
     # Create time-weighted dataset with dynamic week selection
     df_season_data = create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, 
-                                                         target_weeks_2024, current_week_param)
+                                                         target_weeks_2024, current_week)
     
     # Load schedule data if provided
     df_schedule = None
@@ -1016,13 +1236,14 @@ def run_with_time_weighted_data(week_2025_file, weeks_2024_file, target_weeks_20
     
     # Create team and player datasets
     print("Creating team dataset...")
-    df_team = create_team_dataset_from_game_data(df_season_data, df_schedule, current_week_param)
+    df_team = create_team_dataset_from_game_data(df_season_data, df_schedule, current_week)
     
     print("Creating player dataset (active roster only, consolidated by current team)...")
     df_players = create_player_dataset_from_game_data(df_season_data, active_roster, player_team_mapping)
     
     # Save the created datasets for future use
-    df_team.to_csv("nfl25_team.csv")
+    # opps lists are written as OPPS_SEP-joined strings (analyze splits them back)
+    df_team.assign(opps=df_team['opps'].str.join(OPPS_SEP)).to_csv("nfl25_team.csv")
     df_players.to_csv("nfl25_players.csv")
     print("Saved team and player datasets")
     
@@ -1030,7 +1251,7 @@ def run_with_time_weighted_data(week_2025_file, weeks_2024_file, target_weeks_20
     print(f"\nProjection Program End - {end}\n Total: {end - start}\n")
     
     # Run analysis
-    analyze(df_team, df_players, current_week_param)
+    analyze(df_team, df_players, current_week)
 ## main
 if __name__ == "__main__":
     import sys
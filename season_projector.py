@@ -8,8 +8,27 @@ for all 18 weeks of the NFL season and accumulating the results.
 import pandas as pd
 import numpy as np
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime as dt
-from projection import run_with_time_weighted_data, analyze
+from functools import partial
+from projection import (run_with_time_weighted_data, analyze, load_active_roster, create_player_team_mapping,
+                        read_game_data, create_time_weighted_dataset_from_frames,
+                        create_team_dataset_from_game_data, create_player_dataset_from_game_data)
+
+# Weekly projection columns summed into player and team season totals
+SEASON_SUM_COLS = ['proj_pass_att', 'proj_rush_att', 'proj_tar', 'proj_pass_yd', 'proj_rush_yd',
+                   'proj_rec_yd', 'proj_pass_td', 'proj_rush_td', 'proj_rec_td', 'proj_int', 'proj_fum']
+
+# Standard fantasy scoring: points per unit of each season projection column
+FANTASY_SCORING = {
+    'proj_pass_yd': 0.04, 'proj_rush_yd': 0.1, 'proj_rec_yd': 0.1,
+    'proj_pass_td': 4, 'proj_rush_td': 6, 'proj_rec_td': 6,
+    'proj_int': -2, 'proj_fum': -2,
+}
+
+# Season game data installed in each worker process by _init_worker
+_worker_game_data = {}
 
 def run_season_projections(week_2025_file="data/game_data_2025.csv", 
                           weeks_2024_file="data/game_data_2024.csv",
@@ -34,73 +53,36 @@ def run_season_projections(week_2025_file="data/game_data_2025.csv",
     season_dir = "data/season_projections"
     os.makedirs(season_dir, exist_ok=True)
     
-    # Initialize season accumulation dataframes
-    season_player_stats = None
-    season_team_stats = None
-    
-    # Run projections for each week (1-18 for full season)
-    for week in range(1, 19):  # Full season: weeks 1-18
-        print(f"\n{'='*50}")
-        print(f"Processing Week {week}")
-        print(f"{'='*50}")
-        
-        try:
-            # Run weekly projections using existing system
-            # Import the analyze function directly to avoid file conflicts
-            from projection import (load_active_roster, create_player_team_mapping, 
-                                  create_time_weighted_dataset_dynamic, 
-                                  create_team_dataset_from_game_data, 
-                                  create_player_dataset_from_game_data, analyze)
-            
-            # Load active roster and player team mapping
-            active_roster = load_active_roster(roster_file)
-            player_team_mapping = create_player_team_mapping(roster_file)
-            
-            # Create time-weighted dataset with dynamic week selection
-            df_season_data = create_time_weighted_dataset_dynamic(week_2025_file, weeks_2024_file, 
-                                                               target_weeks_2024, week)
-            
-            # Load schedule data if provided
-            df_schedule = None
-            if schedule_file:
-                df_schedule = pd.read_csv(schedule_file)
-                df_schedule['Round Number'] = pd.to_numeric(df_schedule['Round Number'])
-            
-            # Create team and player datasets
-            df_team = create_team_dataset_from_game_data(df_season_data, df_schedule, week)
-            df_players = create_player_dataset_from_game_data(df_season_data, active_roster, player_team_mapping)
-            
-            # Run analysis using the regular analyze function
-            analyze(df_team, df_players, week)
-            
-            # Copy the generated weekly projections to season directory
-            source_file = f"data/projections/nfl25_proj_week{week}.csv"
-            dest_file = os.path.join(season_dir, f"nfl25_proj_week{week}.csv")
-            
-            if os.path.exists(source_file):
-                # Copy file to season directory
-                import shutil
-                shutil.copy2(source_file, dest_file)
-                
-                # Load the weekly projections
-                df_weekly = pd.read_csv(dest_file)
-                
-                # Add week column
-                df_weekly['week'] = week
-                
-                # Accumulate season stats
-                if season_player_stats is None:
-                    season_player_stats = df_weekly.copy()
-                else:
-                    season_player_stats = pd.concat([season_player_stats, df_weekly], ignore_index=True)
-                
-                print(f"Week {week}: {len(df_weekly)} players projected")
-            else:
-                print(f"Warning: Weekly projections file not found for Week {week}")
-                
-        except Exception as e:
-            print(f"Error processing Week {week}: {e}")
-            continue
+    # Inputs shared by every week are loaded once up front; each week only slices the game data
+    print(f"Loading 2025 data from {week_2025_file}...")
+    df_2025 = read_game_data(week_2025_file)
+    print(f"Loading 2024 data from {weeks_2024_file}...")
+    df_2024 = read_game_data(weeks_2024_file)
+    active_roster = load_active_roster(roster_file)
+    player_team_mapping = create_player_team_mapping(roster_file)
+    df_schedule = None
+    if schedule_file:
+        df_schedule = pd.read_csv(schedule_file)
+        df_schedule['Round Number'] = pd.to_numeric(df_schedule['Round Number'])
+    
+    # Weeks are independent given the input data, so they are projected in parallel worker
+    # processes; results come back in week order. Each worker receives the preloaded game data
+    # once through its initializer rather than with every week's task.
+    week_kwargs = dict(target_weeks_2024=target_weeks_2024, df_schedule=df_schedule,
+                       active_roster=active_roster, player_team_mapping=player_team_mapping,
+                       season_dir=season_dir)
+    weeks = range(1, 19)  # Full season: weeks 1-18
+    max_workers = min(len(weeks), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(df_2025, df_2024)) as executor:
+            weekly_results = list(executor.map(partial(_project_week_in_worker, **week_kwargs), weeks))
+    else:
+        weekly_results = [_project_week(week, df_2025, df_2024, **week_kwargs) for week in weeks]
+    
+    # Accumulate season stats
+    weekly_results = [df_weekly for df_weekly in weekly_results if df_weekly is not None]
+    season_player_stats = pd.concat(weekly_results, ignore_index=True) if weekly_results else None
     
     # Generate season-long summaries
     if season_player_stats is not None:
@@ -110,6 +92,81 @@ def run_season_projections(week_2025_file="data/game_data_2025.csv",
     print(f"\nSeason-Long Projection System End - {end}")
     print(f"Total Runtime: {end - start}\n")
 
+def _init_worker(df_2025, df_2024):
+    """
+    Install the parent's preloaded season game data in a season worker process.
+    
+    Args:
+        df_2025: 2025 season game data
+        df_2024: 2024 season game data
+    """
+    _worker_game_data['df_2025'] = df_2025
+    _worker_game_data['df_2024'] = df_2024
+
+def _project_week_in_worker(week, **week_kwargs):
+    """
+    Project one week in a worker process using the game data installed by _init_worker.
+    
+    Args:
+        week: Week number to project
+        **week_kwargs: Remaining _project_week arguments
+    
+    Returns:
+        DataFrame: The week's player projections, or None if the week failed
+    """
+    return _project_week(week, _worker_game_data['df_2025'], _worker_game_data['df_2024'], **week_kwargs)
+
+def _project_week(week, df_2025, df_2024, target_weeks_2024, df_schedule,
+                  active_roster, player_team_mapping, season_dir):
+    """
+    Run the weekly projection engine for one week and load its projections.
+    
+    Runs in a worker process, so failures are reported here and the week is skipped.
+    
+    Args:
+        week: Week number to project
+        df_2025: 2025 season game data, loaded once per season run
+        df_2024: 2024 season game data, loaded once per season run
+        target_weeks_2024: List of 2024 weeks to include as fallback
+        df_schedule: Schedule DataFrame, or None to skip next-opponent lookups
+        active_roster: Set of active player names
+        player_team_mapping: Dict mapping player names to their current team
+        season_dir: Directory the weekly projection CSV is copied into
+    
+    Returns:
+        DataFrame: The week's player projections with a week column, or None if the week failed
+    """
+    print(f"\n{'='*50}")
+    print(f"Processing Week {week}")
+    print(f"{'='*50}")
+    
+    try:
+        # Create time-weighted dataset with dynamic week selection
+        df_season_data = create_time_weighted_dataset_from_frames(df_2025, df_2024, target_weeks_2024, week)
+        
+        # Create team and player datasets
+        df_team = create_team_dataset_from_game_data(df_season_data, df_schedule, week)
+        df_players = create_player_dataset_from_game_data(df_season_data, active_roster, player_team_mapping)
+        
+        # Run analysis using the regular analyze function; it returns the frame it saved,
+        # so the weekly CSV does not have to be parsed back in
+        df_weekly = analyze(df_team, df_players, week).reset_index()
+        
+        # Copy the generated weekly projections to season directory
+        source_file = f"data/projections/nfl25_proj_week{week}.csv"
+        dest_file = os.path.join(season_dir, f"nfl25_proj_week{week}.csv")
+        shutil.copy2(source_file, dest_file)
+        
+        # Add week column
+        df_weekly['week'] = week
+        
+        print(f"Week {week}: {len(df_weekly)} players projected")
+        return df_weekly
+            
+    except Exception as e:
+        print(f"Error processing Week {week}: {e}")
+        return None
+
 def generate_season_summaries(season_data, output_dir):
     """
     Generate season-long summary statistics and projections.
@@ -120,50 +177,25 @@ def generate_season_summaries(season_data, output_dir):
     """
     print("\nGenerating season-long summaries...")
     
+    # name/team repeat across every week, so group on categorical codes instead of hashing strings
+    season_data = season_data.astype({'name': 'category', 'team': 'category'})
+    
     # Player season totals
-    player_season_totals = season_data.groupby('name').agg({
-        'proj_pass_att': 'sum',
-        'proj_rush_att': 'sum', 
-        'proj_tar': 'sum',
-        'proj_pass_yd': 'sum',
-        'proj_rush_yd': 'sum',
-        'proj_rec_yd': 'sum',
-        'proj_pass_td': 'sum',
-        'proj_rush_td': 'sum',
-        'proj_rec_td': 'sum',
-        'proj_int': 'sum',
-        'proj_fum': 'sum',
-        'team': 'first',
-        'week': 'count'  # Games played
-    }).rename(columns={'week': 'games_played'})
-    
-    # Calculate fantasy points (standard scoring)
+    player_groups = season_data.groupby('name', observed=True)
+    player_season_totals = player_groups[SEASON_SUM_COLS].sum()
+    player_season_totals['team'] = player_groups['team'].first()
+    player_season_totals['games_played'] = player_groups['week'].count()
+    
+    # Calculate fantasy points (standard scoring) as one matrix-vector product
     player_season_totals['fantasy_points'] = (
-        player_season_totals['proj_pass_yd'] * 0.04 +
-        player_season_totals['proj_rush_yd'] * 0.1 +
-        player_season_totals['proj_rec_yd'] * 0.1 +
-        player_season_totals['proj_pass_td'] * 4 +
-        player_season_totals['proj_rush_td'] * 6 +
-        player_season_totals['proj_rec_td'] * 6 +
-        player_season_totals['proj_int'] * -2 +
-        player_season_totals['proj_fum'] * -2
+        player_season_totals[list(FANTASY_SCORING)].to_numpy(dtype=np.float64)
+        @ np.array(list(FANTASY_SCORING.values()))
     )
     
     # Team season totals
-    team_season_totals = season_data.groupby('team').agg({
-        'proj_pass_att': 'sum',
-        'proj_rush_att': 'sum',
-        'proj_tar': 'sum', 
-        'proj_pass_yd': 'sum',
-        'proj_rush_yd': 'sum',
-        'proj_rec_yd': 'sum',
-        'proj_pass_td': 'sum',
-        'proj_rush_td': 'sum',
-        'proj_rec_td': 'sum',
-        'proj_int': 'sum',
-        'proj_fum': 'sum',
-        'week': 'count'
-    }).rename(columns={'week': 'total_games'})
+    team_groups = season_data.groupby('team', observed=True)
+    team_season_totals = team_groups[SEASON_SUM_COLS].sum()
+    team_season_totals['total_games'] = team_groups['week'].count()
     
     # Save season summaries
     player_season_totals.to_csv(os.path.join(output_dir, "player_season_totals.csv"))
@@ -7,14 +7,17 @@ with historical game data and generates structured insights for LLM analysis.
 """
 
 import os
+import logging
 import pandas as pd
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 from dotenv import load_dotenv
-from xai_sdk import Client
-from xai_sdk.chat import user, system
+from data_io import read_with_sidecar
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
@@ -26,11 +29,66 @@ MIN_SAMPLE_SIZE = 3
 MIN_DELTA_PERCENTAGE = 15.0
 MAX_NUGGETS = 20
 
+# Prop type -> historical stat column
+PROP_STAT_COLUMNS = {
+    'rush_yds': 'rush_yds',
+    'reception_yds': 'rec_yds',
+    'receptions': 'receptions',
+    'pass_yds': 'pass_yds',
+    'pass_attempts': 'pass_att',
+    'pass_completions': 'pass_cmp',
+    'pass_tds': 'pass_tds',
+    'pass_interceptions': 'pass_int',
+    'rush_att': 'rush_att',
+    'anytime_td': 'anytime_td'  # rush_tds + rec_tds, added by load_data
+}
+
+# Historical game-data columns used by the trend math
+HISTORICAL_COLS = ['player', 'rush_yds', 'rec_yds', 'receptions', 'pass_yds', 'pass_att', 'pass_cmp',
+                   'pass_tds', 'pass_int', 'rush_att', 'rush_tds', 'rec_tds']
+
+# Parse-time dtypes for HISTORICAL_COLS (player names repeat across every game)
+HISTORICAL_DTYPES = {'player': 'category'}
+
 # GROK API Configuration
 GROK_API_KEY = os.getenv('GROK_API_KEY')
 GROK_MODEL = "grok-3"  # Using grok-3 for consistency with picks_agent
 
 
+def _load_historical_file(file_path: str) -> Tuple[Optional[pd.DataFrame], Optional[Exception]]:
+    """
+    Read one season of game data for load_data.
+    
+    Args:
+        file_path: Path to a data/game_data_<year>.csv file
+    
+    Returns:
+        tuple: (historical frame, None) on success, or (None, error) if the read failed
+    """
+    try:
+        # Only the columns the trend math reads are parsed, and only that subset is cached
+        # (data/game_data_<year>_hist.pkl, separate from projection's full-frame sidecar)
+        pickle_file = os.path.splitext(file_path)[0] + "_hist.pkl"
+        df = read_with_sidecar(file_path, _read_historical_columns, pickle_file)
+        return df, None
+    except Exception as e:
+        return None, e
+
+
+def _read_historical_columns(file_path: str) -> pd.DataFrame:
+    """
+    Parse the HISTORICAL_COLS of one game-data CSV.
+    
+    Args:
+        file_path: Path to a data/game_data_<year>.csv file
+    
+    Returns:
+        pd.DataFrame: The file's HISTORICAL_COLS (any the file lacks are skipped), in that order
+    """
+    df = pd.read_csv(file_path, usecols=lambda col: col in HISTORICAL_COLS, dtype=HISTORICAL_DTYPES)
+    return df[[col for col in HISTORICAL_COLS if col in df.columns]]
+
+
 def load_data(week_number: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Load and normalize all required data sources.
@@ -46,22 +104,32 @@ def load_data(week_number: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Data
     # Load historical game data (all seasons)
     historical_stats = []
     data_dir = "data"
-    
-    for file in os.listdir(data_dir):
-        if file.startswith("game_data_") and file.endswith(".csv"):
-            file_path = os.path.join(data_dir, file)
-            try:
-                df = pd.read_csv(file_path)
-                historical_stats.append(df)
-                print(f"Loaded {file}: {len(df)} records")
-            except Exception as e:
-                print(f"Warning: Could not load {file}: {e}")
+    game_files = [file for file in os.listdir(data_dir)
+                  if file.startswith("game_data_") and file.endswith(".csv")]
+    
+    # Season files are independent and the CSV parser releases the GIL, so read them
+    # concurrently; results come back in directory order
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(game_files)))) as executor:
+        results = list(executor.map(_load_historical_file,
+                                    [os.path.join(data_dir, file) for file in game_files]))
+    
+    for file, (df, error) in zip(game_files, results):
+        if error is None:
+            historical_stats.append(df)
+            logger.debug(f"Loaded {file}: {len(df)} records")
+        else:
+            print(f"Warning: Could not load {file}: {error}")
     
     if not historical_stats:
         raise FileNotFoundError("No historical game data files found")
     
     # Combine all historical data
+    season_count = len(historical_stats)
     historical_stats = pd.concat(historical_stats, ignore_index=True)
+    # Player names repeat across every game, so filters and groupbys run on category codes
+    historical_stats['player'] = historical_stats['player'].astype('category')
+    # anytime_td props are scored on combined rushing and receiving TDs
+    historical_stats['anytime_td'] = historical_stats['rush_tds'].fillna(0) + historical_stats['rec_tds'].fillna(0)
     
     # Normalize column names
     historical_stats.columns = historical_stats.columns.str.lower().str.replace(' ', '_')
@@ -82,7 +150,8 @@ def load_data(week_number: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Data
     player_props = pd.read_csv(props_file)
     player_props.columns = player_props.columns.str.lower().str.replace(' ', '_')
     
-    print(f"Data loaded: {len(historical_stats)} historical records, {len(schedule)} games, {len(player_props)} props")
+    print(f"Data loaded: {len(historical_stats)} historical records from {season_count} season files, "
+          f"{len(schedule)} games, {len(player_props)} props")
     
     return historical_stats, schedule, player_props
 
@@ -129,27 +198,17 @@ def filter_props_with_player_data(player_props: pd.DataFrame,
     historical_players = set(historical_stats['player'].unique())
     
     # Filter props to only include players with historical data
-    filtered_props = []
+    # Direct matches win; otherwise the mapped name is used if it has historical data
+    player_names = player_props['player_name']
+    mapped_names = player_names.map(player_mapping)
+    direct_match = player_names.isin(historical_players)
+    mapped_match = ~direct_match & mapped_names.isin(historical_players)
+    
+    keep = direct_match | mapped_match
+    filtered_df = player_props[keep].copy()
+    # Update mapped player names to match historical data
+    filtered_df['player_name'] = player_names.where(direct_match, mapped_names)[keep]
     
-    for _, prop in player_props.iterrows():
-        player_name = prop['player_name']
-        
-        # Try direct match first
-        if player_name in historical_players:
-            filtered_props.append(prop)
-            continue
-        
-        # Try mapped name
-        if player_name in player_mapping:
-            mapped_name = player_mapping[player_name]
-            if mapped_name in historical_players:
-                # Update the player name to match historical data
-                prop_copy = prop.copy()
-                prop_copy['player_name'] = mapped_name
-                filtered_props.append(prop_copy)
-                continue
-    
-    filtered_df = pd.DataFrame(filtered_props)
     print(f"Filtered from {len(player_props)} to {len(filtered_df)} props with historical data")
     
     return filtered_df
@@ -165,20 +224,7 @@ def get_stat_column(prop_type: str) -> Optional[str]:
     Returns:
         str: Corresponding historical stat column name
     """
-    prop_mapping = {
-        'rush_yds': 'rush_yds',
-        'reception_yds': 'rec_yds',
-        'receptions': 'receptions',
-        'pass_yds': 'pass_yds',
-        'pass_attempts': 'pass_att',
-        'pass_completions': 'pass_cmp',
-        'pass_tds': 'pass_tds',
-        'pass_interceptions': 'pass_int',
-        'rush_att': 'rush_att',
-        'anytime_td': 'rush_tds'  # Will combine with rec_tds
-    }
-    
-    return prop_mapping.get(prop_type)
+    return PROP_STAT_COLUMNS.get(prop_type)
 
 
 def extract_opponent_from_props(prop: pd.Series) -> str:
@@ -192,9 +238,20 @@ def extract_opponent_from_props(prop: pd.Series) -> str:
         str: Opponent team name
     """
     # Get home and away teams from the prop data
-    home_team = prop.get('home_team', '')
-    away_team = prop.get('away_team', '')
+    return _matchup_label(prop.get('home_team', ''), prop.get('away_team', ''))
+
+
+def _matchup_label(home_team, away_team) -> str:
+    """
+    Format the matchup label used as a prop's opponent.
     
+    Args:
+        home_team: Home team name from the prop
+        away_team: Away team name from the prop
+    
+    Returns:
+        str: "<away> vs <home>", or "Unknown" if either team is missing
+    """
     # For now, we'll use a simple approach - determine opponent based on team context
     # This could be enhanced with more sophisticated team matching logic
     if home_team and away_team:
@@ -205,127 +262,137 @@ def extract_opponent_from_props(prop: pd.Series) -> str:
     return "Unknown"
 
 
+def _matchup_labels(props: pd.DataFrame) -> np.ndarray:
+    """
+    Format the matchup label for every prop at once (vectorized _matchup_label).
+    
+    Args:
+        props: Player props with home_team and away_team columns
+    
+    Returns:
+        np.ndarray: "<away> vs <home>" per prop, or "Unknown" if either team is missing
+    """
+    if 'home_team' not in props.columns or 'away_team' not in props.columns:
+        return np.full(len(props), "Unknown", dtype=object)
+    
+    home_teams, away_teams = props['home_team'], props['away_team']
+    has_teams = (home_teams.notna() & (home_teams != '') &
+                 away_teams.notna() & (away_teams != ''))
+    labels = away_teams.astype(str) + ' vs ' + home_teams.astype(str)
+    return np.where(has_teams, labels, "Unknown")
+
+
 def compute_trends(filtered_props: pd.DataFrame, 
                   historical_stats: pd.DataFrame,
-                  week_number: int) -> List[Dict]:
+                  week_number: int) -> pd.DataFrame:
     """
     Compute player trends for each prop.
     
     Args:
         filtered_props: Filtered player props
-        historical_stats: Historical game stats
+        historical_stats: Historical game stats from load_data (including its anytime_td column)
         week_number: Current week number for context
     
     Returns:
-        list: List of trend dictionaries
+        pd.DataFrame: One trend row per prop with enough historical games
     """
     print(f"Computing player trends for Week {week_number}...")
     
-    trends = []
-    
-    for _, prop in filtered_props.iterrows():
-        player_name = prop['player_name']
-        prop_type = prop['prop_type']
-        line = prop['point']
-        
-        # Get stat column for this prop type
-        stat_col = get_stat_column(prop_type)
-        if not stat_col:
-            continue
-        
-        # Get player's historical data
-        player_data = historical_stats[historical_stats['player'] == player_name]
-        if player_data.empty:
-            continue
-        
-        # Extract opponent from props data
-        opponent = extract_opponent_from_props(prop)
-        
-        # Calculate career average for this stat
-        if prop_type == 'anytime_td':
-            # Combine rushing and receiving TDs
-            total_tds = player_data['rush_tds'].fillna(0) + player_data['rec_tds'].fillna(0)
-            career_avg = total_tds.mean()
-        else:
-            career_avg = player_data[stat_col].fillna(0).mean()
-        
-        # Calculate last 3 games vs opponent (if available)
-        # For now, use career average as placeholder - could be enhanced with opponent-specific data
-        last_3_vs_opponent = career_avg
-        
-        # Calculate last 5 overall games (form check)
-        last_5_games = player_data.tail(5)[stat_col].fillna(0).mean()
-        
-        # Calculate sample size
-        sample_size = len(player_data)
-        
-        if sample_size >= MIN_SAMPLE_SIZE:
-            trend_data = {
-                'player': player_name,
-                'opponent': opponent,
-                'stat': prop_type,
-                'sample_size': sample_size,
-                'career_avg': career_avg,
-                'last_3_vs_opponent': last_3_vs_opponent,
-                'last_5_games': last_5_games,
-                'line': line,
-                'stat_column': stat_col,
-                'week': week_number
-            }
-            trends.append(trend_data)
+    # Attach the stat column to each prop; props with no matching stat are skipped
+    props = filtered_props.assign(stat_column=filtered_props['prop_type'].map(PROP_STAT_COLUMNS))
+    props = props[props['stat_column'].notna()]
+    
+    # Per-player aggregates for every stat column, computed once instead of filtering
+    # historical_stats per prop (rows keep their historical order for the last-5 window)
+    stat_cols = list(dict.fromkeys(PROP_STAT_COLUMNS.values()))
+    values = historical_stats[stat_cols].fillna(0)
+    players = historical_stats['player']
+    # One grouper serves the career means, the last-5 window and the sample sizes
+    grouped = values.groupby(players, sort=False, observed=True)
+    career_avgs = grouped.mean()
+    last_5_avgs = grouped.tail(5).groupby(players, sort=False, observed=True).mean()
+    sample_sizes = grouped.size()
+    
+    # Gather each prop's aggregates by (player, column) position
+    player_pos = career_avgs.index.get_indexer(props['player_name'])
+    has_data = player_pos >= 0
+    props, player_pos = props[has_data], player_pos[has_data]
+    stat_pos = career_avgs.columns.get_indexer(props['stat_column'])
+    career_avg = career_avgs.to_numpy()[player_pos, stat_pos]
+    last_5_games = last_5_avgs.reindex(career_avgs.index).to_numpy()[player_pos, stat_pos]
+    sample_size = sample_sizes.reindex(career_avgs.index).to_numpy()[player_pos]
+    
+    opponents = _matchup_labels(props)
+    
+    # Trends stay columnar; generate_nuggets filters them before any row is formatted
+    keep = sample_size >= MIN_SAMPLE_SIZE
+    trends = pd.DataFrame({
+        'player': props['player_name'].to_numpy()[keep],
+        'opponent': opponents[keep],
+        'stat': props['prop_type'].to_numpy()[keep],
+        'sample_size': sample_size[keep].astype(np.int64),
+        'career_avg': career_avg[keep].astype(np.float64),
+        # Last 3 games vs opponent - for now, use career average as placeholder
+        'last_3_vs_opponent': career_avg[keep].astype(np.float64),
+        'last_5_games': last_5_games[keep].astype(np.float64),
+        'line': props['point'].to_numpy()[keep],
+        'stat_column': props['stat_column'].to_numpy()[keep],
+        'week': week_number
+    })
     
     print(f"Computed trends for {len(trends)} player/prop combinations")
     return trends
 
 
-def generate_nuggets(trends: List[Dict]) -> List[Dict]:
+def generate_nuggets(trends: pd.DataFrame) -> List[Dict]:
     """
     Generate raw nugget dictionaries from trends.
     
     Args:
-        trends: List of trend dictionaries
+        trends: Trends from compute_trends (a list of trend dictionaries also works)
     
     Returns:
         list: List of nugget dictionaries
     """
     print("Generating nuggets...")
     
-    nuggets = []
-    seen_combinations = set()  # Track unique player/stat combinations
-    
-    for trend in trends:
-        # Create unique key for this player/stat combination
-        unique_key = (trend['player'], trend['stat'])
-        
-        # Skip if we've already seen this combination
-        if unique_key in seen_combinations:
-            continue
-        
-        seen_combinations.add(unique_key)
-        
-        # Use career average for now (could be enhanced with opponent-specific data)
-        average = trend['career_avg']
-        line = trend['line']
-        week_number = trend.get('week', 1)
-        
-        # Calculate delta and percentage
-        delta = average - line
-        delta_pct = (delta / line) * 100 if line != 0 else 0
-        
-        # Apply filters
-        if abs(delta_pct) >= MIN_DELTA_PERCENTAGE:
-            nugget = {
-                'player': trend['player'],
-                'opponent': trend['opponent'],
-                'stat': trend['stat'],
-                'sample_size': trend['sample_size'],
-                'average': round(average, 1),
-                'line': line,
-                'delta_pct': round(delta_pct, 1),
-                'week': week_number,
-                'nugget': f"{trend['player']} averages {average:.1f} {trend['stat']} in {trend['sample_size']} games, {delta_pct:+.1f}% vs Week {week_number} line of {line}."
-            }
-            nuggets.append(nugget)
+    if len(trends) == 0:
+        print("Generated 0 unique nuggets meeting criteria")
+        return []
+    
+    # Keep the first trend per player/stat combination
+    df_trends = pd.DataFrame(trends).drop_duplicates(subset=['player', 'stat'])
+    if 'week' not in df_trends.columns:
+        df_trends['week'] = 1
+    
+    # Use career average for now (could be enhanced with opponent-specific data)
+    average = df_trends['career_avg']
+    line = df_trends['line']
+    delta_pct = np.where(line != 0, (average - line) / line.where(line != 0, 1) * 100, 0)
+    
+    # Apply filters in one pass; only the surviving trends are formatted
+    df_trends = df_trends.assign(delta_pct=delta_pct)
+    df_trends = df_trends[np.abs(delta_pct) >= MIN_DELTA_PERCENTAGE]
+    
+    # Format the sentence per surviving row, then emit every nugget dict in one pass
+    nugget_text = [
+        f"{player} averages {average:.1f} {stat} in {sample_size} games, {delta:+.1f}% vs Week {week} line of {line}."
+        for player, average, stat, sample_size, delta, week, line in zip(
+            df_trends['player'], df_trends['career_avg'].tolist(), df_trends['stat'],
+            df_trends['sample_size'].tolist(), df_trends['delta_pct'].tolist(),
+            df_trends['week'].tolist(), df_trends['line'].tolist())
+    ]
+    nuggets = pd.DataFrame({
+        'player': df_trends['player'],
+        'opponent': df_trends['opponent'],
+        'stat': df_trends['stat'],
+        'sample_size': df_trends['sample_size'],
+        'average': [round(value, 1) for value in df_trends['career_avg'].tolist()],
+        'line': df_trends['line'],
+        'delta_pct': [round(value, 1) for value in df_trends['delta_pct'].tolist()],
+        'week': df_trends['week'],
+        'nugget': nugget_text
+    }, index=df_trends.index).to_dict('records')
     
     print(f"Generated {len(nuggets)} unique nuggets meeting criteria")
     return nuggets
@@ -333,32 +400,25 @@ def generate_nuggets(trends: List[Dict]) -> List[Dict]:
 
 def filter_and_rank_nuggets(nuggets: List[Dict]) -> List[Dict]:
     """
-    Apply final filters and rank nuggets by delta percentage.
+    Rank nuggets by delta percentage and keep the top MAX_NUGGETS.
+    
+    The sample-size and delta filters are not re-applied: compute_trends drops props
+    below MIN_SAMPLE_SIZE and generate_nuggets drops deltas below MIN_DELTA_PERCENTAGE.
     
     Args:
-        nuggets: List of raw nuggets
+        nuggets: List of raw nuggets from generate_nuggets
     
     Returns:
-        list: Filtered and ranked nuggets
+        list: Ranked nuggets
     """
     print("Filtering and ranking nuggets...")
     
-    # Filter by sample size and delta percentage
-    filtered_nuggets = [
-        nugget for nugget in nuggets 
-        if nugget['sample_size'] >= MIN_SAMPLE_SIZE 
-        and abs(nugget['delta_pct']) >= MIN_DELTA_PERCENTAGE
-    ]
-    
-    # Rank by absolute delta percentage (descending)
-    ranked_nuggets = sorted(
-        filtered_nuggets, 
-        key=lambda x: abs(x['delta_pct']), 
-        reverse=True
-    )
+    abs_delta = pd.Series([abs(nugget['delta_pct']) for nugget in nuggets], dtype='float64')
     
-    # Keep top nuggets
-    final_nuggets = ranked_nuggets[:MAX_NUGGETS]
+    # Rank by absolute delta percentage (descending) and keep top nuggets;
+    # nlargest partially sorts and keeps ties in their original order
+    top_positions = abs_delta.nlargest(MAX_NUGGETS, keep='first').index
+    final_nuggets = [nuggets[pos] for pos in top_positions]
     
     print(f"Final result: {len(final_nuggets)} nuggets")
     return final_nuggets
@@ -400,12 +460,25 @@ def send_to_llm(json_file: str, prompt: str) -> str:
     Returns:
         str: LLM response (placeholder for now)
     """
-    print("Preparing data for LLM analysis...")
-    
     # Read the JSON file
     with open(json_file, 'r') as f:
         nuggets_data = json.load(f)
     
+    return build_llm_prompt(nuggets_data)
+
+
+def build_llm_prompt(nuggets_data: List[Dict]) -> str:
+    """
+    Build the LLM analysis prompt from in-memory nuggets.
+    
+    Args:
+        nuggets_data: List of nugget dictionaries
+    
+    Returns:
+        str: LLM prompt (placeholder response for now)
+    """
+    print("Preparing data for LLM analysis...")
+    
     # Create the fixed prompt as specified in the execution document
     llm_prompt = f"""You are an ESPN sports analytics writer. 
 You are given structured NFL trend nuggets in JSON. 
@@ -445,6 +518,10 @@ def call_grok_api(nuggets_data: List[Dict]) -> Dict:
     print("🤖 Calling GROK API for ESPN-style analysis...")
     
     try:
+        # Import the X.AI SDK here so data-only runs skip its import cost
+        from xai_sdk import Client
+        from xai_sdk.chat import user, system
+        
         # Initialize X.AI client
         client = Client(api_key=GROK_API_KEY)
         
@@ -565,7 +642,7 @@ def main(week_number: int = 1) -> Tuple[List[Dict], str]:
         json_file = save_nuggets_to_json(final_nuggets, week_number)
         
         # 8. Prepare for LLM analysis
-        llm_prompt = send_to_llm(json_file, "")
+        llm_prompt = build_llm_prompt(final_nuggets)
         
         # 9. Call GROK API for ESPN-style insights
         grok_response = call_grok_api(final_nuggets)
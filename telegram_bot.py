@@ -18,6 +18,8 @@ class TelegramBot:
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        # One session per bot so repeated sends reuse the keep-alive connection
+        self.session = requests.Session()
         
         if not self.bot_token or not self.chat_id:
             logger.warning("Telegram credentials not found in environment variables")
@@ -40,7 +42,7 @@ class TelegramBot:
                 'parse_mode': parse_mode
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=10)
             response.raise_for_status()
             
             logger.info("Telegram message sent successfully")
@@ -169,7 +171,7 @@ class TelegramBot:
         
         try:
             url = f"{self.base_url}/getMe"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
             bot_info = response.json()